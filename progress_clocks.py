@@ -19,14 +19,28 @@ Structure
 __version__ = "3.0.0"
 
 
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
 import math
 import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, colorchooser
+from tkinter import ttk, messagebox
+# tkinter.colorchooser / tkinter.filedialog are imported where used (only on user action).
 import tkinter.font as tkfont
 
+try:
+    import orjson  # optional: much faster session (de)serialization
+except ImportError:
+    orjson = None
+
 # ---------------------------
 # Config / constants
 # ---------------------------
@@ -35,7 +49,16 @@ TITLE_SPACE = 56
 LINE_W = 3
 SEGMENT_CHOICES = (4, 6, 8, 12)
 AUTOSAVE_MS = 5 * 60 * 1000  # 5 minutes
+AUTOSAVE_DEBOUNCE_MS = 3000  # save this long after the last edit of a burst
+AUTOSAVE_IDLE_FACTOR = 4  # stretch the autosave interval this much while minimized
+TAB_TITLE_MAX = 18  # longer tab titles are cut and end in "…"
+MAX_TIMER_SECONDS = 99 * 3600 + 59 * 60 + 59  # longest Linked countdown (99:59:59)
+
+# Canvas palettes for Light / Dark Mode (shared, never mutated)
+LIGHT_COLORS = {"bg": "white", "fg": "black"}
+DARK_COLORS = {"bg": "black", "fg": "white"}
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     if os.name == "nt":
         base = Path(os.getenv("APPDATA", str(Path.home())))
@@ -43,8 +66,7 @@ def get_app_dir() -> Path:
     else:
         return Path.home() / ".progress_clocks"
 
-APP_DIR = get_app_dir()
-APP_DIR.mkdir(parents=True, exist_ok=True)
+APP_DIR = get_app_dir()  # created lazily by the first settings/session write
 
 DEFAULT_SESSION_PATH = APP_DIR / "session.json"
 SETTINGS_PATH = APP_DIR / "settings.json"
@@ -119,61 +141,136 @@ def _center_geometry_on_rect(width: int, height: int, rect: tuple[int, int, int,
     return f"{int(width)}x{int(height)}+{int(x)}+{int(y)}"
 
 
-# Convert a hex color like '#aabbcc' to an (r,g,b) tuple.
+# 1 / (2*pi): converts an atan2 angle to a fraction of a full turn.
+_INV_TAU = 1 / math.tau
+
+# Arc (start, extent) pairs for `segs` pie slices, clockwise with segment 0 at 12 o'clock.
+@functools.lru_cache(maxsize=8)
+def _arc_params(segs: int) -> tuple[tuple[float, float], ...]:
+    span = 360 / segs
+    return tuple((90 - i * span, -span) for i in range(segs))
+
+# Canvas-space unit vectors (dx, dy) toward the middle of each slice from _arc_params(segs).
+@functools.lru_cache(maxsize=8)
+def _slice_mid_dirs(segs: int) -> tuple[tuple[float, float], ...]:
+    # Mid-angle of slice i in radians, straight from the slice index (no degree round-trip)
+    span = math.tau / segs
+    mids = (math.pi / 2 - (i + 0.5) * span for i in range(segs))
+    return tuple((math.cos(a), -math.sin(a)) for a in mids)  # canvas y grows downward
+
+# Warm both tables for every selectable segment count so no paint ever computes them.
+for _segs in SEGMENT_CHOICES:
+    _arc_params(_segs)
+    _slice_mid_dirs(_segs)
+del _segs
+
+# Convert a hex color like '#aabbcc' to an (r,g,b) tuple (memoized; fill colors repeat).
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str):
     s = hex_color.strip().lstrip("#")
     if len(s) == 3:
-        s = "".join(ch*2 for ch in s)
+        s = s[0]*2 + s[1]*2 + s[2]*2
+    # bytes.fromhex parses all three channels in one call
     try:
-        return (int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16))
-    except Exception:
+        rgb = tuple(bytes.fromhex(s[:6]))
+    except ValueError:
         return (0, 0, 0)
+    return rgb if len(rgb) == 3 else (0, 0, 0)
 
+@functools.lru_cache(maxsize=256)
 def _contrast_text_color(bg_hex: str) -> str:
     r, g, b = _hex_to_rgb(bg_hex)
-    luminance = 0.2126*(r/255) + 0.7152*(g/255) + 0.0722*(b/255)
-    return "#000000" if luminance > 0.6 else "#FFFFFF"
-
-# Generate a non-conflicting 'Base N' title given existing titles.
-def _next_numbered_title(existing_titles, base):
-    used = set()
-    for t in existing_titles:
-        t = (t or "").strip()
-        if t == base:
-            used.add(1)
-        elif t.startswith(base + " "):
-            tail = t[len(base) + 1:].strip()
-            if tail.isdigit():
-                used.add(int(tail))
-    n = 1
-    while n in used:
-        n += 1
-    return f"{base} {n}"
+    # Rec. 709 luminance > 0.6 in exact integers: weights x10000, threshold 0.6 * 255 * 10000
+    return "#000000" if (r*2126 + g*7152 + b*722) > 1530000 else "#FFFFFF"
+
+# Compiled 'Base' / 'Base N' matcher for a numbering base (one per tab type).
+@functools.lru_cache(maxsize=8)
+def _title_pattern(base: str) -> re.Pattern:
+    return re.compile(rf"{re.escape(base)}(?: \s*(\d+))?")
+
+# Number a title claims under `base`: 'Base' -> 1, 'Base N' -> N, anything else -> None.
+def _title_number(title, base):
+    m = _title_pattern(base).fullmatch((title or "").strip())
+    if m is None:
+        return None
+    return int(m.group(1)) if m.group(1) else 1
+
+# Encode a JSON-serializable object to UTF-8 bytes (orjson when available); compact
+# unless `pretty` (indent by 2), so both encoders produce the same bytes.
+def _json_dumps(obj, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+        except TypeError:
+            pass  # e.g. an int beyond 64 bits: the stdlib encoder handles what orjson rejects
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Decode JSON from bytes (orjson when available).
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)  # stdlib accepts bytes directly (detects UTF-8/16/32)
+
+# Open a temp file for binary writing; its folder is only created when the open finds it missing.
+def _open_tmp(tmp: Path):
+    try:
+        return open(tmp, "wb")
+    except FileNotFoundError:
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        return open(tmp, "wb")
+
+# Flag the owning app's session as changed since the last save (no-op outside MultiClockApp).
+def _mark_dirty(widget):
+    # Drop the memoized to_dict() of the widget and of every tab/container holding it
+    w = widget
+    while w is not None:
+        if getattr(w, "_dict_cache", None) is not None:
+            w._dict_cache = None
+        w = getattr(w, "master", None)
+    try:
+        mark = getattr(widget.winfo_toplevel(), "mark_dirty", None)
+    except Exception:
+        return
+    if mark is not None:
+        mark()
 
 def load_settings() -> dict:
     """Read app settings from disk. Returns a dict with defaults if missing."""
     try:
-        if SETTINGS_PATH.exists():
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+        # One-shot read (no exists() probe, no text-mode stream); a missing file lands in except
+        data = _json_loads(SETTINGS_PATH.read_bytes())
+        if isinstance(data, dict):
+            return data
     except Exception:
         pass
     # defaults
     return {
         "open_last_on_launch": False,    # user toggle
+        "fsync_autosave": True,          # user toggle: flush autosaves to disk before swapping them in
         "last_session_path": None,       # updated after a successful save/load
         "last_window_center": None,      # [cx, cy] in virtual screen coords
         "last_window_size": [900, 650],  # [w, h]
     }
 
+# Bytes of the settings file as last written by save_settings() (skip identical rewrites).
+_saved_settings_bytes = None
+
 def save_settings(data: dict) -> None:
-    """Persist app settings to disk."""
+    """Persist app settings to disk (atomically and durably; no-op if unchanged since the last write)."""
+    global _saved_settings_bytes
     try:
-        SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = _json_dumps(data, pretty=True)
+        if payload == _saved_settings_bytes and SETTINGS_PATH.exists():
+            return
+        tmp = SETTINGS_PATH.with_suffix(SETTINGS_PATH.suffix + ".tmp")
+        with _open_tmp(tmp) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())  # rare, off-thread writes: make the swap survive a power cut
+        os.replace(tmp, SETTINGS_PATH)
+        _saved_settings_bytes = payload
     except Exception:
         pass
 
@@ -209,59 +306,280 @@ def center_window_over_parent(parent_widget, top, width=None, height=None):
 # Modal Notes (shared)
 # ---------------------------
 def open_notes_modal(parent, initial_text: str, title_text: str) -> str | None:
+    """Show the notes editor modally; returns the edited text, or None on cancel.
+
+    One dialog per app window is built on first use and kept (withdrawn) for every tab to reuse.
+    """
     root = parent.winfo_toplevel()
-    root.update_idletasks()
+    dlg = getattr(root, "_notes_dialog", None)
+    if dlg is None or not dlg.top.winfo_exists():
+        dlg = NotesDialog(root)
+        root._notes_dialog = dlg
+    return dlg.show(initial_text, title_text)
+
+class NotesDialog:
+    """Notes editor Toplevel shared by all tabs of a window; withdrawn between uses instead of destroyed."""
+    # Helper method: Init.
+    def __init__(self, owner):
+        root = owner.winfo_toplevel()
+        self.top = top = tk.Toplevel(owner)
+        top.withdraw()
+        top.transient(root)
+        top.minsize(420, 260)
+        top.protocol("WM_DELETE_WINDOW", self._cancel)
 
-    top = tk.Toplevel(root)
-    top.title(f"{title_text} — Notes")
-    top.transient(root)
-    top.grab_set()
-    top.minsize(420, 260)
+        frm = ttk.Frame(top, padding=8)
+        frm.pack(fill="both", expand=True)
+        self.txt = tk.Text(frm, wrap="word", height=12)
+        self.txt.pack(fill="both", expand=True)
 
-    # center
-    rx, ry = root.winfo_rootx(), root.winfo_rooty()
-    rw, rh = root.winfo_width(), root.winfo_height()
-    if rw <= 1 or rh <= 1:
+        btns = ttk.Frame(frm)
+        btns.pack(fill="x", pady=(8,0))
+        ttk.Button(btns, text="Save Notes", command=self._save).pack(side="left")
+        ttk.Button(btns, text="Cancel", command=self._cancel).pack(side="right")
+
+        self.result = None
+        self._done = tk.BooleanVar(top, value=False)
+
+    # Re-show the dialog centered over the app and block until Save/Cancel.
+    def show(self, initial_text: str, title_text: str) -> str | None:
+        top = self.top
+        root = top.master.winfo_toplevel()
+        root.update_idletasks()
+        top.title(f"{title_text} — Notes")
+
+        # center
+        rx, ry = root.winfo_rootx(), root.winfo_rooty()
+        rw, rh = root.winfo_width(), root.winfo_height()
+        if rw <= 1 or rh <= 1:
+            try:
+                geom = root.geometry()
+                parts = geom.split("+")
+                size = parts[0].split("x")
+                rw, rh = int(size[0]), int(size[1])
+                rx, ry = int(parts[1]), int(parts[2])
+            except Exception:
+                pass
+        pw, ph = 560, 360
+        px = rx + max(0, (rw - pw)//2)
+        py = ry + max(0, (rh - ph)//2)
+        top.geometry(f"{pw}x{ph}+{px}+{py}")
+
+        self.txt.delete("1.0", "end")
+        if initial_text:
+            self.txt.insert("1.0", initial_text)
+
+        self.result = None
+        top.deiconify()
+        top.grab_set()
+        # Focus once the window is up: next idle pass, no fixed delay and no re-entrant update()
+        top.after_idle(lambda: (self.txt.focus_set(), self.txt.see("end")))
+        top.wait_variable(self._done)
+        return self.result
+
+    # Helper method: Save.
+    def _save(self):
+        self.result = self.txt.get("1.0", "end-1c")
+        self._close()
+
+    # Helper method: Cancel.
+    def _cancel(self):
+        self.result = None
+        self._close()
+
+    # Hide (not destroy) the dialog and release the modal wait.
+    def _close(self):
         try:
-            geom = root.geometry()
-            parts = geom.split("+")
-            size = parts[0].split("x")
-            rw, rh = int(size[0]), int(size[1])
-            rx, ry = int(parts[1]), int(parts[2])
+            self.top.grab_release()
         except Exception:
             pass
-    pw, ph = 560, 360
-    px = rx + max(0, (rw - pw)//2)
-    py = ry + max(0, (rh - ph)//2)
-    top.geometry(f"{pw}x{ph}+{px}+{py}")
-
-    frm = ttk.Frame(top, padding=8)
-    frm.pack(fill="both", expand=True)
-    txt = tk.Text(frm, wrap="word", height=12)
-    txt.pack(fill="both", expand=True)
-    if initial_text:
-        txt.insert("1.0", initial_text)
-
-    btns = ttk.Frame(frm)
-    btns.pack(fill="x", pady=(8,0))
-    result = {"val": None}
-
-    # Helper method: Do save.
-    def do_save():
-        result["val"] = txt.get("1.0", "end-1c")
-        top.destroy()
-
-    # Helper method: Do cancel.
-    def do_cancel():
-        result["val"] = None
-        top.destroy()
-
-    ttk.Button(btns, text="Save Notes", command=do_save).pack(side="left")
-    ttk.Button(btns, text="Cancel", command=do_cancel).pack(side="right")
-
-    top.after(50, lambda: (txt.focus_set(), txt.see("end")))
-    parent.wait_window(top)
-    return result["val"]
+        self.top.withdraw()
+        self._done.set(True)
+
+# ---------------------------
+# Modal segment label (shared)
+# ---------------------------
+def open_label_modal(parent, initial_text: str, title_text: str) -> str | None:
+    """Prompt for one segment label; returns the entered text, or None on cancel.
+
+    Like the notes editor, one prompt per app window is built on first use and reused.
+    """
+    root = parent.winfo_toplevel()
+    dlg = getattr(root, "_label_dialog", None)
+    if dlg is None or not dlg.top.winfo_exists():
+        dlg = LabelDialog(root)
+        root._label_dialog = dlg
+    return dlg.show(parent, initial_text, title_text)
+
+class LabelDialog:
+    """Single-line label prompt Toplevel; withdrawn between uses instead of destroyed."""
+    # Helper method: Init.
+    def __init__(self, owner):
+        self.top = top = tk.Toplevel(owner)
+        top.withdraw()
+        top.transient(owner.winfo_toplevel())
+        top.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        frm = ttk.Frame(top, padding=8)
+        frm.pack(fill="both", expand=True)
+        self.ent = ttk.Entry(frm, width=36)
+        self.ent.pack(fill="x")
+
+        btns = ttk.Frame(frm)
+        btns.pack(fill="x", pady=(8, 0))
+        ttk.Button(btns, text="OK", command=self._ok).pack(side="left")
+        ttk.Button(btns, text="Cancel", command=self._cancel).pack(side="right")
+
+        self.result = None
+        self._done = tk.BooleanVar(top, value=False)
+
+    # Re-show the prompt centered over `parent` and block until OK/Cancel.
+    def show(self, parent, initial_text: str, title_text: str) -> str | None:
+        top = self.top
+        top.title(title_text)
+        self.ent.delete(0, "end")
+        self.ent.insert(0, initial_text or "")
+        center_window_over_parent(parent, top)
+
+        self.result = None
+        top.deiconify()
+        top.grab_set()
+        top.after_idle(lambda: (self.ent.focus_set(), self.ent.select_range(0, "end")))
+        top.wait_variable(self._done)
+        return self.result
+
+    # Helper method: Ok.
+    def _ok(self):
+        self.result = self.ent.get()
+        self._close()
+
+    # Helper method: Cancel.
+    def _cancel(self):
+        self.result = None
+        self._close()
+
+    # Hide (not destroy) the prompt and release the modal wait.
+    def _close(self):
+        try:
+            self.top.grab_release()
+        except Exception:
+            pass
+        self.top.withdraw()
+        self._done.set(True)
+
+# ---------------------------
+# Modal bulk label editor (shared)
+# ---------------------------
+def open_edit_labels_modal(parent, labels: list[str], on_clear) -> list[str] | None:
+    """Edit all segment labels at once; returns the stripped labels, or None on cancel.
+
+    `on_clear` runs when Clear All is pressed (it applies immediately, even if the dialog is
+    then cancelled). One editor per app window, with rows for the largest segment count.
+    """
+    root = parent.winfo_toplevel()
+    dlg = getattr(root, "_edit_labels_dialog", None)
+    if dlg is None or not dlg.top.winfo_exists():
+        dlg = EditLabelsDialog(root)
+        root._edit_labels_dialog = dlg
+    return dlg.show(parent, labels, on_clear)
+
+class EditLabelsDialog:
+    """Bulk label editor Toplevel; rows beyond the clock's segment count are hidden, not rebuilt."""
+    # Helper method: Init.
+    def __init__(self, owner):
+        self.top = top = tk.Toplevel(owner)
+        top.withdraw()
+        top.transient(owner.winfo_toplevel())
+        top.title("Edit Segment Labels")
+        top.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        frm = ttk.Frame(top, padding=8)
+        frm.pack(fill="both", expand=True)
+
+        # One grid for all rows (no per-row frames)
+        rows = ttk.Frame(frm)
+        rows.pack(fill="x")
+        rows.columnconfigure(1, weight=1)
+        self.rows = []  # (label, entry) per segment slot
+        for i in range(max(SEGMENT_CHOICES)):
+            lbl = ttk.Label(rows, text=f"Segment {i+1}")
+            lbl.grid(row=i, column=0, sticky="w", padx=(0, 8), pady=2)
+            e = ttk.Entry(rows, width=32)
+            e.grid(row=i, column=1, sticky="we", pady=2)
+            self.rows.append((lbl, e))
+
+        btns = ttk.Frame(frm)
+        btns.pack(fill="x", pady=(8, 0))
+        ttk.Button(btns, text="Save Labels", command=self._save).pack(side="left")
+        ttk.Button(btns, text="Clear All", command=self._clear_all).pack(side="left", padx=8)
+        ttk.Button(btns, text="Cancel", command=self._cancel).pack(side="right")
+
+        self.result = None
+        self._count = 0
+        self._on_clear = None
+        self._done = tk.BooleanVar(top, value=False)
+
+    # Re-show the editor for `labels`, centered over `parent`, and block until Save/Cancel.
+    def show(self, parent, labels: list[str], on_clear) -> list[str] | None:
+        top = self.top
+        self._count = count = min(len(labels), len(self.rows))
+        self._on_clear = on_clear
+        for i, (lbl, e) in enumerate(self.rows):
+            if i < count:
+                lbl.grid()
+                e.grid()
+                e.delete(0, "end")
+                e.insert(0, labels[i] or "")
+            else:
+                lbl.grid_remove()
+                e.grid_remove()
+
+        # --- Auto-size the window to fit the visible rows, then center over parent ---
+        try:
+            top.update_idletasks()
+            req_w = max(420, top.winfo_reqwidth())
+            req_h = max(260, top.winfo_reqheight())
+            center_window_over_parent(parent, top, width=int(req_w), height=int(req_h))
+        except Exception:
+            try:
+                center_window_over_parent(parent, top)
+            except Exception:
+                pass
+
+        self.result = None
+        top.deiconify()
+        top.grab_set()
+        first = self.rows[0][1]
+        top.after_idle(lambda: (first.focus_set(), first.select_range(0, "end")))
+        top.wait_variable(self._done)
+        self._on_clear = None
+        return self.result
+
+    # Helper method: Save.
+    def _save(self):
+        self.result = [e.get().strip() for _, e in self.rows[:self._count]]
+        self._close()
+
+    # Helper method: Cancel.
+    def _cancel(self):
+        self.result = None
+        self._close()
+
+    # Clear the entries and, right away, the clock's labels.
+    def _clear_all(self):
+        for _, e in self.rows[:self._count]:
+            e.delete(0, "end")
+        if self._on_clear is not None:
+            self._on_clear()
+
+    # Hide (not destroy) the editor and release the modal wait.
+    def _close(self):
+        try:
+            self.top.grab_release()
+        except Exception:
+            pass
+        self.top.withdraw()
+        self._done.set(True)
 
 class SimpleSettingsDialog(tk.Toplevel):
     """Reusable modal with a vertical list of checkboxes and OK/Cancel."""
@@ -339,13 +657,70 @@ class ClockBase(ttk.Frame):
 
         self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
         self.canvas.grid(row=1, column=0, columnspan=8, sticky="nsew", padx=8, pady=8)
-        self.canvas.bind("<Configure>", lambda e: self.draw())
+        # Resize storms fire many <Configure> events; coalesce them into one idle redraw.
+        self._redraw_job = None
+        # Fallback redraw while the canvas is still too small to lay out (at most one queued).
+        self._small_retry_job = None
+        # Canvas size as reported by <Configure>, so draw() needn't query winfo_width/height.
+        self._canvas_size = None
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # Title last painted by draw(); lets title edits skip no-op redraws.
+        self._last_rendered_title = None
+        # Set while applying bulk state (from_dict); draw() is a no-op until cleared.
+        self._suppress_draw = False
+
+    # Remember the new canvas size and request a redraw.
+    def _on_canvas_configure(self, event):
+        self._canvas_size = (event.width, event.height)
+        self._schedule_draw()
+
+    # Current canvas (width, height), from the last <Configure> when available.
+    def _get_canvas_size(self):
+        if self._canvas_size is not None:
+            return self._canvas_size
+        return (int(self.canvas.winfo_width() or 0), int(self.canvas.winfo_height() or 0))
+
+    # Request a redraw on the next idle pass; repeated requests collapse into one.
+    def _schedule_draw(self):
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._do_draw)
+
+    # title_var write trace: mark dirty; redraw only if the text differs from what is on the canvas.
+    def _on_title_changed(self, *_):
+        _mark_dirty(self)
+        if self.title_var.get() != self._last_rendered_title:
+            self._schedule_draw()
+
+    # Run the coalesced redraw scheduled by _schedule_draw().
+    def _do_draw(self):
+        self._redraw_job = None
+        self.draw()
+
+    # Canvas too small to paint yet: try again shortly, unless a retry is already queued.
+    def _retry_draw_later(self):
+        if self._small_retry_job is None:
+            self._small_retry_job = self.after(50, self._on_small_retry)
+
+    # Helper method: On small retry.
+    def _on_small_retry(self):
+        self._small_retry_job = None
+        self._schedule_draw()
 
     # Helper method: Destroy.
     def destroy(self):
-        # detach shared dark-mode trace if any
+        # drop any pending coalesced redraw / small-canvas retry
+        for attr in ("_redraw_job", "_small_retry_job"):
+            job = getattr(self, attr, None)
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+        # detach the dark-mode trace: a shared var outlives us, and even on our own var the
+        # Tcl-side callback would keep this frame alive
         try:
-            if getattr(self, "_uses_shared_inverted", False) and getattr(self, "_inv_trace_id", None):
+            if getattr(self, "_inv_trace_id", None):
                 self.inverted.trace_remove("write", self._inv_trace_id)
                 self._inv_trace_id = None
         except Exception:
@@ -355,17 +730,19 @@ class ClockBase(ttk.Frame):
     # React to dark/light mode changes, preserving readable fill colors; redraw.
     def _on_theme_changed(self):
         """Hook for subclasses when theme flips; default just redraws."""
-        self.draw()
+        _mark_dirty(self)
+        self._schedule_draw()
 
     # Return a dict of background/foreground colors for current theme.
     def _colors(self):
-        return {"bg":"black","fg":"white"} if self.inverted.get() else {"bg":"white","fg":"black"}
+        return DARK_COLORS if self.inverted.get() else LIGHT_COLORS
 
     # Open a modal to view/edit free-form notes for this tab/clock.
     def open_notes(self):
         res = open_notes_modal(self, self.notes, self.title_var.get() or "Clock")
-        if res is not None:
+        if res is not None and res != self.notes:
             self.notes = res
+            _mark_dirty(self)
 
     # to be implemented by subclasses
     def draw(self): ...
@@ -381,6 +758,17 @@ class ClockBase(ttk.Frame):
 class DangerClockFrame(ClockBase):
     """ Circular "progress clock" with N pie-slice segments. Supports click-to-fill/unfill, labels, dark mode, color, and serialization. """
     TYPE = "danger"
+    _dict_cache = None  # memoized to_dict(); cleared by _mark_dirty() on any change
+
+    # (dark mode on?, current fill lowercased) -> default fill to switch to; custom colors absent.
+    _THEME_DEFAULT_FILL_SWAP = {
+        (True, "#000000"): "#FFFFFF", (True, "black"): "#FFFFFF",    # Dark Mode ON: black bg
+        (False, "#ffffff"): "#000000", (False, "white"): "#000000",  # Dark Mode OFF: white bg
+    }
+
+    # Keyboard shortcuts shared by every clock canvas: keysym -> method name.
+    _KEY_BINDTAG = "DangerClockKeys"
+    _KEY_ACTIONS = {"plus": "increase", "minus": "decrease", "r": "reset", "R": "reset"}
 
     def __init__(self, master, initial_title="Danger Clock", segments=4, filled=0,
                  inverted=False, fill_color=None, notes="",
@@ -394,6 +782,10 @@ class DangerClockFrame(ClockBase):
         super().__init__(master, initial_title=initial_title, inverted=inverted, notes=notes,
                          shared_inverted_var=shared_inverted_var)
 
+        # Canvas items are created once here; draw() only moves/recolors/hides them.
+        self._title_font = tkfont.Font(family="Arial", size=16, weight="bold")
+        self._build_canvas_items(max(SEGMENT_CHOICES))
+
         # If embedded inside LinkedClocksFrame, keep a backref so Reset can talk to timers.
         self._linked_parent = linked_parent
 
@@ -401,10 +793,9 @@ class DangerClockFrame(ClockBase):
         ttk.Label(self, text="Clock Name:").grid(row=0, column=0, padx=6, pady=(8, 0), sticky="w")
         title_entry = ttk.Entry(self, textvariable=self.title_var, width=20, justify="left")
         title_entry.grid(row=0, column=1, padx=(0, 12), pady=(8, 0), sticky="w")
-        # Redraw the canvas whenever the title changes
-        self.title_var.trace_add("write", lambda *_: self.draw())
-        # OPTIONAL: live-update on each keystroke as well
-        title_entry.bind("<KeyRelease>", lambda e: self.draw())
+        # Redraw the canvas (and mark the session dirty) whenever the title changes; the trace
+        # fires on every real edit, so no <KeyRelease> hook (arrows/modifiers would only dirty it)
+        self._title_trace_id = self.title_var.trace_add("write", self._on_title_changed)
         # Settings button on the top bar
         # Hide when embedded in Linked Clocks (they have a single tab Settings)
         # or when the caller (e.g., Racing) requests no per‑dial Settings.
@@ -496,44 +887,92 @@ class DangerClockFrame(ClockBase):
         if enable_label_ui:
             ttk.Checkbutton(line2, text="Show Labels",
                             variable=self.show_labels,
-                            command=self.draw).pack(side="left", padx=6)
+                            command=self._on_show_labels_toggled).pack(side="left", padx=6)
             ttk.Button(line2, text="Edit Labels", command=self.edit_labels).pack(side="left", padx=6)
 
-        # Keyboard shortcuts
-        self.bind_all("+", lambda e: self.increase())
-        self.bind_all("-", lambda e: self.decrease())
-        self.bind_all("<r>", lambda e: self.reset())
-        self.bind_all("<R>", lambda e: self.reset())
+        # Keyboard shortcuts: one class binding shared by all clock canvases, dispatched to
+        # whichever canvas has focus (Linked dials keep serial order via clicks)
+        if click_mode == "normal":
+            self.canvas.configure(takefocus=1)
+            self.canvas.bind("<Enter>", self._focus_canvas)
+            if not self.canvas.bind_class(self._KEY_BINDTAG):
+                self.canvas.bind_class(self._KEY_BINDTAG, "<KeyPress>", DangerClockFrame._on_key)
+            self.canvas.bindtags((self._KEY_BINDTAG,) + self.canvas.bindtags())
+
+        # Defer the first draw until after the widget has a real size (shares the <Configure> slot)
+        self._schedule_draw()
+
+    # Fill color of filled wedges; setting it also caches the label color that contrasts with it
+    # and drops this clock's memoized to_dict() (callers still _mark_dirty for the session/tab).
+    @property
+    def fill_color(self) -> str:
+        return self._fill_color
+
+    @fill_color.setter
+    def fill_color(self, value: str):
+        if value != getattr(self, "_fill_color", None):
+            self._dict_cache = None
+        self._fill_color = value
+        self._fill_contrast = _contrast_text_color(value) if isinstance(value, str) else "#FFFFFF"
+
+    # Run the shortcut for a key pressed on a clock canvas.
+    @staticmethod
+    def _on_key(event):
+        action = DangerClockFrame._KEY_ACTIONS.get(event.keysym)
+        frame = getattr(event.widget, "master", None)
+        if action and isinstance(frame, DangerClockFrame):
+            getattr(frame, action)()
+
+    # Give the canvas keyboard focus (for +/-/r) unless the user is typing in a text field.
+    def _focus_canvas(self, event=None):
+        try:
+            focused = self.focus_get()
+        except Exception:
+            focused = None
+        if isinstance(focused, (tk.Entry, ttk.Entry, tk.Text)):
+            return
+        self.canvas.focus_set()
 
-        # Defer the first draw until after the widget has a real size
-        self.after_idle(self.draw)
+    def filled_count(self) -> int:
+        """Number of filled segments (list.count runs in C; no per-item Python loop)."""
+        return self.filled.count(True)
 
     def is_complete(self) -> bool:
-        return sum(self.filled) >= int(self.segments.get())
+        return self.filled_count() >= int(self.segments.get())
 
     def last_filled_index(self) -> int | None:
         """Return the highest index currently filled, or None if none."""
-        n = sum(self.filled)
+        n = self.filled_count()
         return (n - 1) if n > 0 else None
 
     # Helper method: Destroy.
     def destroy(self):
-        # detach shared segments trace if any, then let base remove its trace, then destroy
+        # detach shared segments + title traces, then let base remove its trace, then destroy
         try:
             if getattr(self, "_uses_shared_segments", False) and getattr(self, "_seg_trace_id", None):
                 self.segments.trace_remove("write", self._seg_trace_id)
                 self._seg_trace_id = None
         except Exception:
             pass
+        try:
+            if getattr(self, "_title_trace_id", None):
+                self.title_var.trace_remove("write", self._title_trace_id)
+                self._title_trace_id = None
+        except Exception:
+            pass
         super().destroy()
 
+    # Show Labels toggled: remember the change and redraw.
+    def _on_show_labels_toggled(self):
+        _mark_dirty(self)
+        self._schedule_draw()
+
     # Helper method: On left click.
     def _on_left_click(self, event):
         """Fill the clicked segment (turn it on)."""
         idx = self._pos_to_segment(event.x, event.y)
         if idx is not None:
-            self.filled[idx] = True
-            self._redraw_circle()
+            self._set_segment(idx, True)
 
     # Defer single-click handling to distinguish from double-clicks.
     def _on_single_click_candidate(self, event):
@@ -556,8 +995,7 @@ class DangerClockFrame(ClockBase):
         self._single_click_job = None
         idx = self._pos_to_segment(x, y)
         if idx is not None:
-            self.filled[idx] = True
-            self._redraw_circle()
+            self._set_segment(idx, True)
 
 
     # Unfill the right-clicked segment.
@@ -565,8 +1003,7 @@ class DangerClockFrame(ClockBase):
         """Un-fill the clicked segment (turn it off)."""
         idx = self._pos_to_segment(event.x, event.y)
         if idx is not None:
-            self.filled[idx] = False
-            self._redraw_circle()
+            self._set_segment(idx, False)
 
     # Map a canvas (x,y) click to the corresponding segment index or None.
     def _pos_to_segment(self, x, y):
@@ -574,9 +1011,10 @@ class DangerClockFrame(ClockBase):
         Given a canvas (x,y) click, return the segment index 0..N-1,
         or None if the click is outside the circle.
         """
-        import math
-
-        seg_count = int(self.segments.get())
+        # Segment count/span as of the last draw(); avoids a Tk variable read per click
+        seg_count = getattr(self, "_hit_seg_count", None)
+        if seg_count is None:
+            seg_count = int(self.segments.get())
         if seg_count <= 0:
             return None
 
@@ -585,38 +1023,37 @@ class DangerClockFrame(ClockBase):
         cy = getattr(self, "center_y", None)
         r = getattr(self, "radius", None)
 
-        # Fallback (shouldn't be needed once draw() has run)
+        # Not painted yet (click raced the first idle draw): paint now, then use its geometry
         if cx is None or cy is None or r is None:
-            w = int(self.canvas.winfo_width() or self.canvas.cget("width"))
-            h = int(self.canvas.winfo_height() or self.canvas.cget("height"))
-            size = min(w, h)
-            pad = size * 0.05
-            cx, cy = w / 2, h / 2
-            r = (size / 2) - pad
+            self.draw()
+            cx = getattr(self, "center_x", None)
+            cy = getattr(self, "center_y", None)
+            r = getattr(self, "radius", None)
+            if cx is None or cy is None or r is None:
+                return None  # canvas still too small to hold a clock
 
         # Outside the circle? Ignore.
         dx, dy = x - cx, y - cy
-        if (dx * dx + dy * dy) > (r * r):
+        if (dx * dx + dy * dy) > self._hit_r2:
             return None
 
-        # Angle from +X axis with Y flipped (so "up" is positive)
-        angle_deg = math.degrees(math.atan2(-dy, dx)) % 360
-
         # Our wedges are drawn CLOCKWISE from 12 o'clock:
         #   start_deg = 90 - i*seg_span, extent = -seg_span
-        # So measure CLOCKWISE from top:
-        angle_clockwise_from_top = (90 - angle_deg) % 360
+        # atan2(dx, -dy) measures clockwise from top directly (canvas y grows down);
+        # as a fraction of a full turn it maps straight onto the segment index.
+        turn = (math.atan2(dx, -dy) * _INV_TAU) % 1.0
+        idx = int(turn * seg_count)
 
-        seg_span = 360 / seg_count
-        idx = int(angle_clockwise_from_top // seg_span)
-
-        # Clamp (safety)
-        if idx < 0: idx = 0
+        # turn is in [0, 1), but a hair-negative angle can round up to exactly 1.0
         if idx >= seg_count: idx = seg_count - 1
+        # A segment-count change may be waiting on its redraw; ignore clicks past the list
+        if idx >= len(self.filled):
+            return None
         return idx
 
     # Open a color chooser and apply a new fill color.
     def choose_fill_color(self):
+        from tkinter import colorchooser
         (rgb, hexv) = colorchooser.askcolor(
             color=self.fill_color,
             title="Choose fill color",
@@ -627,7 +1064,8 @@ class DangerClockFrame(ClockBase):
             self.fill_color = hexv
             try: self.fill_preview.configure(bg=hexv)
             except Exception: pass
-            self.draw()
+            _mark_dirty(self)
+            self._schedule_draw()
 
     # Resize internal lists to match segment count and redraw.
     def _clamp_and_draw(self):
@@ -635,29 +1073,27 @@ class DangerClockFrame(ClockBase):
         target = int(self.segments.get())
         self._resize_filled_to(target)
         self._resize_labels_to(target)
-        self.draw()
+        _mark_dirty(self)
+        self._schedule_draw()
 
     # Fill one more segment (advance progress).
     def increase(self):
         # Increase count of filled segments by 1
-        current = sum(self.filled)
-        if current < int(self.segments.get()):
-            self._set_fill_count(current + 1)
-            self.draw()
+        current = self.filled_count()
+        if current < len(self.filled):  # kept at the segment count; no Tk var read
+            self._apply_fill_count(current + 1)
 
     # Unfill one segment (reverse progress).
     def decrease(self):
         # Decrease count of filled segments by 1
-        current = sum(self.filled)
+        current = self.filled_count()
         if current > 0:
-            self._set_fill_count(current - 1)
-            self.draw()
+            self._apply_fill_count(current - 1)
 
     # Clear progress (unfill all segments).
     def reset(self):
         # Clear all segments
-        self._set_fill_count(0)
-        self.draw()
+        self._apply_fill_count(0)
 
     # Prompt for reset and apply related options specific to this clock.
     def reset_with_prompt(self):
@@ -682,6 +1118,7 @@ class DangerClockFrame(ClockBase):
                 self.fill_preview.configure(bg=self.fill_color)
             except Exception:
                 pass
+            _mark_dirty(self)
 
             if ans == "yes":
                 try:
@@ -701,12 +1138,44 @@ class DangerClockFrame(ClockBase):
             parent=self.winfo_toplevel()
         )
         if ans == "yes":
-            self.labels = [""] * int(self.segments.get())
-            self.show_labels.set(self.show_labels.get())  # keep toggle state
+            self.clear_labels()
         self.reset()
 
+    # Blank every segment label (keeps the Show Labels toggle); repaints on the next idle pass.
+    def clear_labels(self):
+        if any(self.labels):
+            self.labels = [""] * len(self.labels)
+            _mark_dirty(self)
+            self._schedule_draw()
+
+    # Create the persistent canvas items that draw() repositions/recolors in place.
+    def _build_canvas_items(self, count: int):
+        """(Re)create title, `count` arcs/labels, border, dot and overlay items (z-order bottom→top)."""
+        c = self.canvas
+        c.delete("all")
+        self._last_draw_state = None  # fresh items: next draw() must paint
+        self._layout_key = None       # ... and position everything
+        self._title_fit_key = None    # ... and re-fit the title font
+        self._label_key = None        # ... and re-place the labels
+        self._theme_key = None        # ... and color the static items
+        self._title_id = c.create_text(0, 0, text="", anchor="n", state="hidden")
+        # Outlined pie slices draw their own radial edges, so no separate spoke lines are needed.
+        self._arc_ids = [
+            c.create_arc(0, 0, 0, 0, style=tk.PIESLICE, width=1, state="hidden", tags=("clock_arc",))
+            for _ in range(count)
+        ]
+        self._border_id = c.create_oval(0, 0, 0, 0, width=LINE_W, state="hidden")
+        self._dot_id = c.create_oval(0, 0, 0, 0, state="hidden")
+        self._label_ids = [
+            c.create_text(0, 0, text="", font=("Arial", 11, "bold"), justify="center", state="hidden")
+            for _ in range(count)
+        ]
+        self._overlay_id = c.create_text(0, 0, text="", state="hidden")
+
     # Render/redraw the widget canvas based on current state.
     def draw(self):
+        if self._suppress_draw:
+            return
         # Bail out cleanly if widget/canvas is gone (during teardown)
         if not self.winfo_exists():
             return
@@ -715,139 +1184,167 @@ class DangerClockFrame(ClockBase):
             return
 
         # If the canvas is still tiny (e.g., first layout pass), wait and redraw later
-        w = int(c.winfo_width() or 0)
-        h = int(c.winfo_height() or 0)
+        w, h = self._get_canvas_size()
         if w < 120 or h < 120:
-            self.after(50, self.draw)
+            self._retry_draw_later()
             return
 
-        c = self.canvas
-        c.delete("all")
-        colors = self._colors()
-        c.configure(bg=colors["bg"])
-        w = max(1, c.winfo_width()); h = max(1, c.winfo_height())
+        inverted = bool(self.inverted.get())
+        seg_count = max(1, int(self.segments.get()))
+        title_text = self.title_var.get()
+
+        # Nothing that affects the picture changed since the last paint (e.g. a tab switch) → skip.
+        show_labels = bool(self.show_labels.get())
+        state = (w, h, inverted, seg_count, title_text, self.fill_color, tuple(self.filled),
+                 show_labels, tuple(self.labels),
+                 getattr(self, "_overlay_text", None), getattr(self, "_overlay_color", "#000000"))
+        last = self._last_draw_state
+        if state == last:
+            return
+        # Only the timer overlay changed (a Linked Clocks tick): update just that item.
+        if last is not None and state[:-2] == last[:-2]:
+            self._paint_overlay(self.center_x, self.center_y, self.radius)
+            self._last_draw_state = state
+            return
+
+        colors = DARK_COLORS if inverted else LIGHT_COLORS  # theme already read for the snapshot
+
+        if len(self._arc_ids) < seg_count:
+            self._build_canvas_items(seg_count)
+
+        # Background, title, border and dot only change color with the theme.
+        recolor = inverted != self._theme_key
+        self._theme_key = inverted
+        if recolor:
+            c.configure(bg=colors["bg"])
 
         # ----- Title (auto-fit to width, wrap if still too long) -----
-        title_text = self.title_var.get()
+        # Only re-measure when the text or width changed; theme/fill changes just recolor it.
         avail_w = max(1, w - 2 * PADDING)
-
-        size = 16
-        try:
-            f = tkfont.Font(family="Arial", size=size, weight="bold")
-            while f.measure(title_text) > avail_w and size > 9:
-                size -= 1
+        if (avail_w, title_text) != self._title_fit_key:
+            self._title_fit_key = (avail_w, title_text)
+            size = 16
+            wrap_w = 0
+            try:
+                f = self._title_font
                 f.configure(size=size)
-        except Exception:
-            f = ("Arial", 12, "bold")
-
-        extra = {}
-        try:
-            # If even the smallest font is still too wide, allow wrapping
-            if isinstance(f, tkfont.Font) and f.measure(title_text) > avail_w:
-                extra["width"] = avail_w
-                extra["justify"] = "center"
-        except Exception:
-            pass
+                while f.measure(title_text) > avail_w and size > 9:
+                    size -= 1
+                    f.configure(size=size)
+                # If even the smallest font is still too wide, allow wrapping
+                if f.measure(title_text) > avail_w:
+                    wrap_w = avail_w
+            except Exception:
+                f = ("Arial", 12, "bold")
 
-        # Draw from the very top (anchor north) so it doesn’t overlap the circle
-        c.create_text(w / 2, 8, text=title_text, font=f, fill=colors["fg"], anchor="n", **extra)
+            # Draw from the very top (anchor north) so it doesn’t overlap the circle
+            c.coords(self._title_id, w / 2, 8)
+            c.itemconfigure(self._title_id, text=title_text, font=f, width=wrap_w,
+                            justify="center", state="normal")
+            self._last_rendered_title = title_text
+        if recolor:
+            c.itemconfigure(self._title_id, fill=colors["fg"])
 
         usable_h = max(1, h - TITLE_SPACE)
         r = max(1, min((w - 2*PADDING), (usable_h - 2*PADDING)) / 2)
         cx, cy = w/2, TITLE_SPACE + usable_h/2
         x0, y0, x1, y1 = cx - r, cy - r, cx + r, cy + r
 
-        segs = max(1, int(self.segments.get()))
-        extent = 360 / segs
-        start_base = 90
-
-        # per-segment wedges (fill = True/False)
-        seg_count = max(1, int(self.segments.get()))
-        seg_span = 360 / seg_count
-
-        # store center/radius for click detection
+        # store center/radius/slice count for click detection
         self.center_x, self.center_y = cx, cy
         self.radius = r
+        self._hit_r2 = r * r
+        self._hit_seg_count = seg_count
 
-        # clear any previously tagged arcs (if you ever redraw without clearing all)
-        c.delete("clock_arc")
+        # Geometry (bbox, slice angles, visibility) only changes with size or segment count;
+        # otherwise just recolor the existing items.
+        layout_key = (w, h, seg_count)
+        relayout = layout_key != self._layout_key
+        self._layout_key = layout_key
 
-        for i in range(seg_count):
-            start_deg = 90 - (i * seg_span)           # put segment 0 at 12 o’clock
-            is_filled = (i < len(self.filled)) and self.filled[i]
-            fill_color = self.fill_color if is_filled else ""
-
-            c.create_arc(
-                x0, y0, x1, y1,
-                start=start_deg,
-                extent=-seg_span,                     # clockwise
-                style=tk.PIESLICE,
-                fill=fill_color,
-                outline="#111111",
-                width=2,
-                tags=("clock_arc",),
-            )
-
-        # spokes
-        for i in range(segs):
-            ang = math.radians(start_base - i*extent)
-            x_end = cx + r*math.cos(ang)
-            y_end = cy - r*math.sin(ang)
-            c.create_line(cx, cy, x_end, y_end, width=2, fill=colors["bg"])
-            c.create_line(cx, cy, x_end, y_end, width=1, fill=colors["fg"])
+        # per-segment wedges (fill = True/False)
+        # One pass over the wedge pool: live wedges are placed/filled, spares hidden.
+        arc_params = _arc_params(seg_count)
+        coords, itemconfigure = c.coords, c.itemconfigure
+        bbox = (x0, y0, x1, y1)
+        fill_color, fg = self.fill_color, colors["fg"]
+        filled = self.filled
+        for i, arc_id in enumerate(self._arc_ids):
+            if i >= seg_count:
+                if not relayout:
+                    break
+                itemconfigure(arc_id, state="hidden")
+                continue
+            fill = fill_color if (i < len(filled) and filled[i]) else ""
+            if relayout:
+                start_deg, extent = arc_params[i]
+                coords(arc_id, *bbox)
+                itemconfigure(arc_id, start=start_deg, extent=extent, state="normal", fill=fill, outline=fg)
+            elif recolor:
+                itemconfigure(arc_id, fill=fill, outline=fg)
+            else:
+                # Outlines (spokes + rim) only change with the theme: restyle the fill alone
+                itemconfigure(arc_id, fill=fill)
 
         # border + dot
-        c.create_oval(x0, y0, x1, y1, width=LINE_W, outline=colors["fg"])
-        c.create_oval(cx-3, cy-3, cx+3, cy+3, fill=colors["fg"], outline=colors["fg"])
+        if relayout:
+            c.coords(self._border_id, x0, y0, x1, y1)
+            c.coords(self._dot_id, cx-3, cy-3, cx+3, cy+3)
+        if recolor:
+            c.itemconfigure(self._border_id, outline=colors["fg"], state="normal")
+            c.itemconfigure(self._dot_id, fill=colors["fg"], outline=colors["fg"], state="normal")
 
         # ----- Labels (on top) -----
-        if self.show_labels.get():
-            seg_count = max(1, int(self.segments.get()))
-            seg_span = 360 / seg_count
-            label_r = r * 0.60  # distance from center for text
-
-            for i in range(seg_count):
-                text = (self.labels[i] if i < len(self.labels) else "").strip()
-                if not text:
-                    continue
-
-                # mid-angle of the wedge (drawing is clockwise)
-                start_deg = 90 - (i * seg_span)
-                mid_deg = start_deg - (seg_span / 2)
-                ang = math.radians(mid_deg)
-
-                tx = cx + label_r * math.cos(ang)
-                ty = cy - label_r * math.sin(ang)
-
-                # Choose a readable text color:
-                # - if the segment is filled, contrast against the fill color
-                # - otherwise, use the normal foreground color
-                if (i < len(self.filled)) and self.filled[i]:
-                    tcolor = _contrast_text_color(self.fill_color)
-                else:
-                    tcolor = colors["fg"]
-
-                self.canvas.create_text(
-                    tx, ty,
-                    text=text,
-                    fill=tcolor,
-                    font=("Arial", 11, "bold"),
-                    justify="center",
-                )
+        label_r = r * 0.60  # distance from center for text
+        mid_dirs = _slice_mid_dirs(seg_count)
+        filled_text_color = self._fill_contrast  # same for every filled wedge
+        # Text/visibility/position only change with the labels, the toggle or the layout;
+        # otherwise (fills, theme) the visible labels are just recolored.
+        label_key = (show_labels, tuple(self.labels))
+        relabel = relayout or label_key != self._label_key
+        self._label_key = label_key
+        for i, label_id in enumerate(self._label_ids):
+            text = (self.labels[i] if i < len(self.labels) else "").strip()
+            if not show_labels or i >= seg_count or not text:
+                if relabel:
+                    c.itemconfigure(label_id, state="hidden")
+                continue
+
+            # Choose a readable text color:
+            # - if the segment is filled, contrast against the fill color
+            # - otherwise, use the normal foreground color
+            if (i < len(filled)) and filled[i]:
+                tcolor = filled_text_color
+            else:
+                tcolor = fg
+
+            if not relabel:
+                c.itemconfigure(label_id, fill=tcolor)
+                continue
+
+            # mid-angle of the wedge (drawing is clockwise)
+            dx, dy = mid_dirs[i]
+            c.coords(label_id, cx + label_r * dx, cy + label_r * dy)
+            c.itemconfigure(label_id, text=text, fill=tcolor, state="normal")
+
+        self._paint_overlay(cx, cy, r)
+        self._last_draw_state = state
+
+    # Show/hide the centered overlay text (Linked Clocks timers) for a clock at (cx, cy) radius r.
+    def _paint_overlay(self, cx, cy, r):
+        c = self.canvas
         overlay = getattr(self, "_overlay_text", None)
         overlay_color = getattr(self, "_overlay_color", "#000000")
         if overlay:
             try:
-                r = getattr(self, "radius", 60)
                 size = max(12, int(r * 0.28))
-                self.canvas.create_text(
-                    self.center_x, self.center_y,
-                    text=overlay,
-                    font=("Consolas", size, "bold"),
-                    fill=overlay_color
-                )
+                c.coords(self._overlay_id, cx, cy)
+                c.itemconfigure(self._overlay_id, text=overlay, font=("Consolas", size, "bold"),
+                                fill=overlay_color, state="normal")
             except Exception:
                 pass
+        else:
+            c.itemconfigure(self._overlay_id, state="hidden")
 
     # React to dark/light mode changes, preserving readable fill colors; redraw.
     def _on_theme_changed(self):
@@ -858,26 +1355,16 @@ class DangerClockFrame(ClockBase):
           If fill is white (the dark-mode default), switch back to black.
         Custom colors are left untouched.
         """
-        fill = (self.fill_color or "").lower()
-
-        if self.inverted.get():
-            # Dark Mode ON: background becomes black
-            if fill in ("#000000", "black"):
-                self.fill_color = "#FFFFFF"
-                try:
-                    self.fill_preview.configure(bg=self.fill_color)
-                except Exception:
-                    pass
-        else:
-            # Dark Mode OFF: background becomes white
-            if fill in ("#ffffff", "white"):
-                self.fill_color = "#000000"
-                try:
-                    self.fill_preview.configure(bg=self.fill_color)
-                except Exception:
-                    pass
+        swap = self._THEME_DEFAULT_FILL_SWAP.get((bool(self.inverted.get()), (self.fill_color or "").lower()))
+        if swap is not None:
+            self.fill_color = swap
+            try:
+                self.fill_preview.configure(bg=swap)
+            except Exception:
+                pass
 
-        self.draw()
+        _mark_dirty(self)
+        self._schedule_draw()
 
     # Open a modal with settings toggles and apply changes.
     def open_settings(self):
@@ -889,61 +1376,79 @@ class DangerClockFrame(ClockBase):
 
     # serialization
     def to_dict(self):
-        return {
+        cached = self._dict_cache
+        if cached is not None:
+            return cached  # nothing changed since the last save (see _mark_dirty)
+        # The legacy "filled" count is no longer written; from_dict still reads it from old sessions
+        self._dict_cache = d = {
             "type": self.TYPE,
             "title": self.title_var.get(),
-            "segments": int(self.segments.get()),
-            "filled": int(sum(self.filled)),  # keep for backward compatibility
-            "filled_list": list(bool(v) for v in self.filled),  # NEW: exact pattern
+            "filled_list": [bool(v) for v in self.filled],  # exact pattern
             "labels": list(self.labels),  # NEW
             "show_labels": bool(self.show_labels.get()),  # NEW
-            "inverted": bool(self.inverted.get()),
             "fill_color": self.fill_color,
             "notes": self.notes,
         }
+        # Racing/Linked dials share these with their tab, which saves them once
+        if not self._uses_shared_segments:
+            d["segments"] = int(self.segments.get())
+        if not self._uses_shared_inverted:
+            d["inverted"] = bool(self.inverted.get())
+        return d
 
     # Load state from a previously serialized dict.
     def from_dict(self, data: dict):
-        # basic fields
-        self.title_var.set(data.get("title", "Danger Clock"))
-        self.segments.set(int(data.get("segments", 4)))
-        self.inverted.set(bool(data.get("inverted", False)))
-        self.fill_color = data.get("fill_color", self.fill_color)
-        self.notes = data.get("notes", "")
-
-        # ensure list lengths match segments
-        segs = int(self.segments.get())
-        self._resize_filled_to(segs)
-        self._resize_labels_to(segs)
-
-        # prefer exact fill pattern if present
-        flist = data.get("filled_list")
-        if isinstance(flist, list) and len(flist) > 0:
-            pattern = [bool(v) for v in flist][:segs]
-            if len(pattern) < segs:
-                pattern += [False] * (segs - len(pattern))
-            self.filled = pattern
-        else:
-            count = int(data.get("filled", 0))
-            self._set_fill_count(count)
-
-        # labels + toggle
-        lbls = data.get("labels")
-        if isinstance(lbls, list):
-            lbls = [str(v) if v is not None else "" for v in lbls][:segs]
-            if len(lbls) < segs:
-                lbls += [""] * (segs - len(lbls))
-            self.labels = lbls
-        else:
-            self.labels = [""] * segs
+        self._dict_cache = None
+        # Trace callbacks fired by the setters below would each redraw; paint once at the end instead.
+        self._suppress_draw = True
+        try:
+            # basic fields
+            self.title_var.set(data.get("title", "Danger Clock"))
+            # Shared (Racing/Linked) vars belong to the tab; its from_dict has already set them
+            if not self._uses_shared_segments:
+                self.segments.set(int(data.get("segments", 4)))
+            if not self._uses_shared_inverted:
+                self.inverted.set(bool(data.get("inverted", False)))
+            self.fill_color = data.get("fill_color", self.fill_color)
+            self.notes = data.get("notes", "")
+
+            # ensure list lengths match segments
+            segs = int(self.segments.get())
+            self._resize_filled_to(segs)
+            self._resize_labels_to(segs)
+
+            # prefer exact fill pattern if present
+            flist = data.get("filled_list")
+            if isinstance(flist, list) and len(flist) > 0:
+                pattern = [False] * segs
+                for i, v in enumerate(flist[:segs]):
+                    pattern[i] = bool(v)
+                self.filled = pattern
+            else:
+                count = int(data.get("filled", 0))
+                self._set_fill_count(count)
+
+            # labels + toggle
+            lbls = data.get("labels")
+            if isinstance(lbls, list):
+                labels = [""] * segs
+                for i, v in enumerate(lbls[:segs]):
+                    if v is not None:
+                        labels[i] = str(v)
+                self.labels = labels
+            else:
+                self.labels = [""] * segs
 
-        self.show_labels.set(bool(data.get("show_labels", False)))
+            self.show_labels.set(bool(data.get("show_labels", False)))
 
-        try:
-            self.fill_preview.configure(bg=self.fill_color)
-        except Exception:
-            pass
-        self.draw()
+            try:
+                self.fill_preview.configure(bg=self.fill_color)
+            except Exception:
+                pass
+        finally:
+            self._suppress_draw = False
+        # One idle paint; during a session load this batches with the tabs' resize events
+        self._schedule_draw()
 
 
     # Resize the filled-segments list to a new segment count.
@@ -954,17 +1459,51 @@ class DangerClockFrame(ClockBase):
         if new_count > cur:
             self.filled += [False] * (new_count - cur)
         elif new_count < cur:
-            self.filled = self.filled[:new_count]
+            del self.filled[new_count:]
 
     # Set the first N segments filled; others unfilled.
-    def _set_fill_count(self, n: int):
-        """Fill the first n segments True, rest False."""
-        n = max(0, min(int(n), int(self.segments.get())))
-        self.filled = [True]*n + [False]*(int(self.segments.get()) - n)
+    def _set_fill_count(self, n: int) -> list[int]:
+        """Fill the first n segments True, rest False (in place); returns the indices that flipped."""
+        segs = int(self.segments.get())
+        n = max(0, min(int(n), segs))
+        self._resize_filled_to(segs)
+        filled = self.filled
+        changed = [i for i, was in enumerate(filled) if was != (i < n)]
+        for i in changed:
+            filled[i] = not filled[i]
+        return changed
+
+    # Set the fill count and recolor only the segments whose state changed.
+    def _apply_fill_count(self, n: int):
+        changed = self._set_fill_count(n)
+        if changed:
+            _mark_dirty(self)
+            self._update_segments(changed)
+
+    # Recolor the wedge + label of the given segments in place (no full redraw).
+    def _update_segments(self, indices):
+        c = self.canvas
+        # Theme as last painted (a pending theme flip repaints everything anyway): no Tk var read
+        fg = (DARK_COLORS if self._theme_key else LIGHT_COLORS)["fg"]
+        fill_color = self.fill_color
+        filled_text_color = self._fill_contrast
+        # Labels as last painted; hidden ones get their color when draw() next shows them
+        shown, texts = self._label_key or (False, ())
+        for i in indices:
+            if i >= len(self._arc_ids):
+                self.draw()
+                return
+            is_filled = (i < len(self.filled)) and self.filled[i]
+            c.itemconfigure(self._arc_ids[i], fill=fill_color if is_filled else "")
+            if shown and i < len(texts) and texts[i].strip():
+                c.itemconfigure(self._label_ids[i], fill=filled_text_color if is_filled else fg)
 
-    # Convenience wrapper to trigger a redraw.
-    def _redraw_circle(self):
-        self.draw()
+    # Fill/unfill one segment and recolor just that wedge.
+    def _set_segment(self, idx: int, value: bool):
+        if self.filled[idx] != value:
+            self.filled[idx] = value
+            _mark_dirty(self)
+            self._update_segments([idx])
 
     # Resize the labels list to a new segment count.
     def _resize_labels_to(self, new_count: int):
@@ -973,7 +1512,7 @@ class DangerClockFrame(ClockBase):
         if new_count > cur:
             self.labels += [""] * (new_count - cur)
         elif new_count < cur:
-            self.labels = self.labels[:new_count]
+            del self.labels[new_count:]
 
     # Open an editor to set per-segment labels in bulk.
     def edit_labels(self):
@@ -981,66 +1520,11 @@ class DangerClockFrame(ClockBase):
         segs = int(self.segments.get())
         self._resize_labels_to(segs)
 
-        top = tk.Toplevel(self)
-        top.title("Edit Segment Labels")
-
-        frm = ttk.Frame(top, padding=8)
-        frm.pack(fill="both", expand=True)
-
-        entries = []
-        for i in range(segs):
-            row = ttk.Frame(frm)
-            row.pack(fill="x", pady=2)
-            ttk.Label(row, text=f"Segment {i+1}").pack(side="left", padx=(0,8))
-            e = ttk.Entry(row, width=32)
-            e.pack(side="left", fill="x", expand=True)
-            e.insert(0, self.labels[i] or "")
-            entries.append(e)
-
-        btns = ttk.Frame(frm)
-        btns.pack(fill="x", pady=(8, 0))
-
-        # Helper method: Do save.
-        def do_save():
-            for i, e in enumerate(entries):
-                self.labels[i] = e.get().strip()
-            top.destroy()
-            self.draw()
-
-        # Helper method: Do cancel.
-        def do_cancel():
-            top.destroy()
-
-        # Helper method: Do clear all.
-        def do_clear_all():
-            # Clear widgets immediately, and also clear labels on the clock
-            for i, e in enumerate(entries):
-                e.delete(0, "end")
-                self.labels[i] = ""
-            self.draw()
-
-        ttk.Button(btns, text="Save Labels", command=do_save).pack(side="left")
-        ttk.Button(btns, text="Clear All", command=do_clear_all).pack(side="left", padx=8)  # <— NEW
-        ttk.Button(btns, text="Cancel", command=do_cancel).pack(side="right")
-
-        # --- Auto-size the window to fit all rows, then center over parent ---
-        try:
-            top.update_idletasks()
-            req_w = max(420, top.winfo_reqwidth())
-            req_h = max(260, top.winfo_reqheight())
-            try:
-                center_window_over_parent(self, top, width=int(req_w), height=int(req_h))
-            except Exception:
-                pass
-        except Exception:
-            try:
-                center_window_over_parent(self, top)
-            except Exception:
-                pass
-
-        # focus first entry
-        top.after(50, lambda: (entries[0].focus_set(), entries[0].select_range(0, 'end')))
-        self.wait_window(top)
+        res = open_edit_labels_modal(self, self.labels, self.clear_labels)
+        if res is not None and res != self.labels[:len(res)]:
+            self.labels[:len(res)] = res
+            _mark_dirty(self)
+            self._schedule_draw()
 
     # Quickly set a label for the double-clicked segment.
     def _on_double_click(self, event):
@@ -1055,52 +1539,15 @@ class DangerClockFrame(ClockBase):
         idx = self._pos_to_segment(event.x, event.y)
         if idx is None:
             return
-        # quick prompt
-        top = tk.Toplevel(self)
-        top.title(f"Label for Segment {idx + 1}")
-        center_window_over_parent(self, top)
-
-        frm = ttk.Frame(top, padding=8);
-        frm.pack(fill="both", expand=True)
-
-        ent = ttk.Entry(frm, width=36)
-        ent.pack(fill="x");
-        ent.insert(0, self.labels[idx] or "")
-        btns = ttk.Frame(frm);
-        btns.pack(fill="x", pady=(8, 0))
-
-        # Helper method: Ok.
-        def ok():
-            self.labels[idx] = ent.get().strip()
-            top.destroy();
-            self.draw()
-
-        # Helper method: Cancel.
-        def cancel():
-            top.destroy()
-
-        ttk.Button(btns, text="OK", command=ok).pack(side="left")
-        ttk.Button(btns, text="Cancel", command=cancel).pack(side="right")
-        top.after(50, lambda: (ent.focus_set(), ent.select_range(0, 'end')))
-        self.wait_window(top)
-
-        top.transient(self.winfo_toplevel()); top.grab_set()
-        center_window_over_parent(self, top)
-        frm = ttk.Frame(top, padding=8); frm.pack(fill="both", expand=True)
-        ent = ttk.Entry(frm, width=36)
-        ent.pack(fill="x"); ent.insert(0, self.labels[idx] or "")
-        btns = ttk.Frame(frm); btns.pack(fill="x", pady=(8,0))
-        # Helper method: Ok.
-        def ok():
-            self.labels[idx] = ent.get().strip()
-            top.destroy(); self.draw()
-        # Helper method: Cancel.
-        def cancel():
-            top.destroy()
-        ttk.Button(btns, text="OK", command=ok).pack(side="left")
-        ttk.Button(btns, text="Cancel", command=cancel).pack(side="right")
-        top.after(50, lambda: (ent.focus_set(), ent.select_range(0, 'end')))
-        self.wait_window(top)
+        # quick prompt (shared, reused dialog)
+        res = open_label_modal(self, self.labels[idx] or "", f"Label for Segment {idx + 1}")
+        if res is None:
+            return
+        text = res.strip()
+        if text != self.labels[idx]:
+            self.labels[idx] = text
+            _mark_dirty(self)
+            self._schedule_draw()
 
 class RacingClocksFrame(ttk.Frame):
     """
@@ -1108,6 +1555,7 @@ class RacingClocksFrame(ttk.Frame):
     Each dial is a DangerClockFrame wired to shared vars.
     """
     TYPE = "racing"
+    _dict_cache = None  # memoized to_dict(); cleared by _mark_dirty() on any change
     MAX_DIALS = 6
 
     # Helper method: Init.
@@ -1157,21 +1605,33 @@ class RacingClocksFrame(ttk.Frame):
         # At least two dials to start
         count = max(2, min(int(initial_dials or 2), self.MAX_DIALS))
         for _ in range(count):
-            self._add_dial()
+            self._add_dial(relayout=False)
 
-        # Now that dials exist, set initial button states
+        # Now that dials exist, lay them out once and set initial button states
+        self._relayout()
         self._update_dial_buttons()
 
-        # React to shared var changes
-        self.segments_var.trace_add("write", lambda *_: self._on_segments_changed())
-        self.inverted_var.trace_add("write", lambda *_: self._on_theme_changed_all())
+        # React to shared var changes (ids kept so destroy() can detach them)
+        self._seg_trace = self.segments_var.trace_add("write", lambda *_: self._on_segments_changed())
+        self._inv_trace = self.inverted_var.trace_add("write", lambda *_: self._on_theme_changed_all())
+
+    # Detach the shared-var traces (their closures hold this frame), then destroy the dials.
+    def destroy(self):
+        try:
+            self.segments_var.trace_remove("write", self._seg_trace)
+            self.inverted_var.trace_remove("write", self._inv_trace)
+        except Exception:
+            pass
+        self._clear_dials()
+        super().destroy()
 
     # ---- UI actions ----
 
     def open_notes(self):
         res = open_notes_modal(self, self.notes, self.title_var.get() or "Racing Clock")
-        if res is not None:
+        if res is not None and res != self.notes:
             self.notes = res
+            _mark_dirty(self)
 
     # Reset all child clocks/timers on this tab.
     def reset_all(self):
@@ -1184,16 +1644,15 @@ class RacingClocksFrame(ttk.Frame):
         )
         clear_labels = (ans == "yes")
 
+        # Each dial recolors its changed wedges in place and queues at most one idle repaint
         for d in self.dials:
             if clear_labels:
-                d.labels = [""] * int(d.segments.get())
-                # keep the current Show Labels toggle state
-                d.show_labels.set(d.show_labels.get())
+                d.clear_labels()
             d.reset()
 
     # ---- Internal helpers ----
 
-    def _add_dial(self):
+    def _add_dial(self, relayout: bool = True):
         if len(self.dials) >= self.MAX_DIALS:
             return
         dial = DangerClockFrame(
@@ -1206,8 +1665,10 @@ class RacingClocksFrame(ttk.Frame):
             show_settings_button=False,  # hide per‑dial Settings in Racing
         )
         self.dials.append(dial)
-        self._relayout()
-        self._update_dial_buttons()
+        _mark_dirty(self)
+        if relayout:
+            self._relayout()
+            self._update_dial_buttons()
 
     # Lay out child dials responsively based on available width/rows/columns.
     def _relayout(self):
@@ -1257,12 +1718,16 @@ class RacingClocksFrame(ttk.Frame):
             dial.destroy()
         except Exception:
             pass
+        _mark_dirty(self)
         self._relayout()
         self._update_dial_buttons()
 
     # ---- Persistence ----
     def to_dict(self) -> dict:
-        return {
+        cached = self._dict_cache
+        if cached is not None:
+            return cached  # nothing changed since the last save (see _mark_dirty)
+        self._dict_cache = result = {
             "type": self.TYPE,
             "title": self.title_var.get(),
             "segments": int(self.segments_var.get()),
@@ -1271,9 +1736,14 @@ class RacingClocksFrame(ttk.Frame):
             # Save each dial using its own serializer
             "dials": [d.to_dict() for d in self.dials],
         }
+        return result
 
     # Load state from a previously serialized dict.
     def from_dict(self, data: dict):
+        self._dict_cache = None
+        # Drop the old dials first so the shared-var writes below don't redraw widgets about to go away
+        self._clear_dials()
+
         # Tab-level fields first (so shared vars are set before dials read)
         self.title_var.set(data.get("title", "Racing Clock"))
         self.segments_var.set(int(data.get("segments", 4)))
@@ -1284,9 +1754,8 @@ class RacingClocksFrame(ttk.Frame):
         dials_data = data.get("dials") or []
         self._rebuild_from_dials(dials_data)
 
-    # Helper method: Rebuild from dials.
-    def _rebuild_from_dials(self, dials_data: list):
-        # Clear old dials
+    # Destroy all dials (used before rebuilding from saved data).
+    def _clear_dials(self):
         for d in self.dials:
             try:
                 d.destroy()
@@ -1294,25 +1763,31 @@ class RacingClocksFrame(ttk.Frame):
                 pass
         self.dials.clear()
 
+    # Helper method: Rebuild from dials.
+    def _rebuild_from_dials(self, dials_data: list):
+        self._clear_dials()
+
         # Build new dials; ensure at least two
         target = max(2, min(len(dials_data) or 2, self.MAX_DIALS))
         for i in range(target):
-            self._add_dial()
+            self._add_dial(relayout=False)  # grid once below, not per dial
 
-        # Feed dicts into dials, but remove per-dial "segments" and "inverted"
-        # so they don't fight with the shared tab-level vars
+        # Feed dicts into dials (they ignore any per-dial "segments"/"inverted" from older
+        # files: the shared tab-level vars win)
         for dial, dd in zip(self.dials, dials_data):
-            if not isinstance(dd, dict):
-                continue
-            dd = dict(dd)  # shallow copy
-            dd.pop("segments", None)
-            dd.pop("inverted", None)
-            dial.from_dict(dd)
+            if isinstance(dd, dict):
+                dial.from_dict(dd)
 
         # If there were fewer saved dials than current, clear extras (shouldn’t happen with target calc)
         self._relayout()
         self._update_dial_buttons()
 
+@dataclass(slots=True)
+class DialTimerState:
+    """Per-dial countdown record for Linked Clocks (configured seconds + runtime elapsed)."""
+    timer_seconds: int = 0
+    elapsed_ms: int = 0
+
 class LinkedClocksFrame(ttk.Frame):
     """
     Linked series of 2..6 circular dials.
@@ -1322,6 +1797,7 @@ class LinkedClocksFrame(ttk.Frame):
     - If ANY timer is specified, ALL timers must be specified to Start.
     """
     TYPE = "linked"
+    _dict_cache = None  # memoized to_dict(); cleared by _mark_dirty() on any change
     MAX_DIALS = 6
 
     TICK_MS = 250  # update resolution for timers
@@ -1392,6 +1868,7 @@ class LinkedClocksFrame(ttk.Frame):
 
         # Helper method: Choose overlay color.
         def _choose_overlay_color():
+            from tkinter import colorchooser
             (rgb, hexv) = colorchooser.askcolor(
                 color=self.overlay_color.get(),
                 title="Choose overlay text color",
@@ -1429,19 +1906,27 @@ class LinkedClocksFrame(ttk.Frame):
         for r in range(2):
             self.dials_frame.rowconfigure(r, weight=1)
 
-        self.dials_frame.bind("<Configure>", lambda e: self._relayout())
+        # Column count of the current grid; resizes only re-grid when it would change.
+        self._grid_cols = None
+        self.dials_frame.bind("<Configure>", self._on_dials_configure)
 
         self.dials: list[DangerClockFrame] = []
-        self.timer_secs: list[tk.IntVar] = []      # per-dial configured countdown seconds
-        self.elapsed_ms: list[int] = []  # NEW: runtime elapsed per dial (ms)
+        self.timers: list[DialTimerState] = []  # per-dial countdown seconds + elapsed ms
+        # (dial that accepts clicks or None, right-click unfill allowed?) — see _bind_serial_clicks
+        self._click_target = (None, False)
 
         # Build initial 2..6
         count = max(2, min(int(initial_dials or 2), self.MAX_DIALS))
         for _ in range(count): self._add_dial()
 
-        # Watch shared vars
-        self.segments_var.trace_add("write", lambda *_: self._on_segments_changed())
-        self.inverted_var.trace_add("write", lambda *_: self._on_theme_changed_all())
+        # Watch shared vars (ids kept so destroy() can detach them)
+        self._seg_trace = self.segments_var.trace_add("write", lambda *_: self._on_segments_changed())
+        self._inv_trace = self.inverted_var.trace_add("write", lambda *_: self._on_theme_changed_all())
+        # Saved toggles: the Settings checkbuttons write them immediately (Cancel included)
+        self._flag_traces = [
+            (var, var.trace_add("write", lambda *_: _mark_dirty(self)))
+            for var in (self._show_overlay, self.beep_on_complete)
+        ]
 
         self._validate_start_button()
         self._redraw_overlays()
@@ -1451,7 +1936,9 @@ class LinkedClocksFrame(ttk.Frame):
     # ------------- Public-ish actions -------------
     def open_notes(self):
         res = open_notes_modal(self, self.notes, self.title_var.get() or "Linked Clocks")
-        if res is not None: self.notes = res
+        if res is not None and res != self.notes:
+            self.notes = res
+            _mark_dirty(self)
 
     # Reset all child clocks/timers on this tab.
     def reset_all(self):
@@ -1474,6 +1961,7 @@ class LinkedClocksFrame(ttk.Frame):
                 d.fill_preview.configure(bg=d.fill_color)
             except Exception:
                 pass
+            _mark_dirty(d)  # the color alone is a change, even with nothing filled
             d.reset()
 
 
@@ -1549,7 +2037,8 @@ class LinkedClocksFrame(ttk.Frame):
             return
 
         # ---- proportional timing branch ----
-        total_ms = max(0, self.timer_secs[idx].get() * 1000)
+        timer = self.timers[idx]
+        total_ms = max(0, timer.timer_seconds * 1000)
         if total_ms == 0:
             # no timer on this dial (shouldn't happen if validation passed)
             self._redraw_overlays()
@@ -1558,20 +2047,18 @@ class LinkedClocksFrame(ttk.Frame):
             return
 
         # advance elapsed for the active dial
-        self.elapsed_ms[idx] = min(total_ms, self.elapsed_ms[idx] + self.TICK_MS)
+        timer.elapsed_ms = min(total_ms, timer.elapsed_ms + self.TICK_MS)
 
         # compute how many segments should be filled by now
         segs = int(self.segments_var.get())
-        target_fill = int((self.elapsed_ms[idx] / total_ms) * segs)
+        target_fill = int((timer.elapsed_ms / total_ms) * segs)
 
-        # apply (idempotent)
-        self.dials[idx]._set_fill_count(min(target_fill, segs))
-        self.dials[idx].draw()
+        # apply (idempotent; recolors only wedges that changed)
+        self.dials[idx]._apply_fill_count(min(target_fill, segs))
 
         # if we’ve reached total time, ensure filled; next tick will move to next dial
-        if self.elapsed_ms[idx] >= total_ms:
-            self.dials[idx]._set_fill_count(segs)
-            self.dials[idx].draw()
+        if timer.elapsed_ms >= total_ms:
+            self.dials[idx]._apply_fill_count(segs)
             if getattr(self, "beep_on_complete", None) and self.beep_on_complete.get():
                 self._beep_once()
 
@@ -1581,11 +2068,11 @@ class LinkedClocksFrame(ttk.Frame):
 
     def _timers_in_use(self) -> bool:
         # any positive configured time?
-        return any(v.get() > 0 for v in self.timer_secs)
+        return any(t.timer_seconds > 0 for t in self.timers)
 
     def _validate_timers(self) -> bool:
         """If ANY time is set, ALL must be set > 0."""
-        vals = [v.get() for v in self.timer_secs]
+        vals = [t.timer_seconds for t in self.timers]
         any_set = any(v > 0 for v in vals)
         if not any_set:  # manual-click mode ok
             return True
@@ -1598,7 +2085,7 @@ class LinkedClocksFrame(ttk.Frame):
 
     # Enable Start only when timers are all-set or all-clear; show/hide hint.
     def _validate_start_button(self):
-        timers = [v.get() for v in self.timer_secs]
+        timers = [t.timer_seconds for t in self.timers]
         any_set = any(t > 0 for t in timers)
         all_set = all(t > 0 for t in timers) if timers else False
         can_start = (not any_set) or (all_set)
@@ -1622,17 +2109,15 @@ class LinkedClocksFrame(ttk.Frame):
 
     # Helper to reset timer/elapsed for a dial by index and refresh UI.
     def _reset_timer_by_index(self, i: int):
-        """Helper: zero timer IntVar/elapsed and refresh its entry text/overlays."""
+        """Helper: zero timer seconds/elapsed and refresh its entry text/overlays."""
         if i < 0 or i >= len(self.dials):
             return
         try:
-            self.timer_secs[i].set(0)
-        except Exception:
-            pass
-        try:
-            self.elapsed_ms[i] = 0
+            self.timers[i].timer_seconds = 0
+            self.timers[i].elapsed_ms = 0
         except Exception:
             pass
+        _mark_dirty(self)
         # Update visible entry text to "00:00:00" if we have it
         try:
             ent = getattr(self.dials[i], "_timer_entry", None)
@@ -1648,71 +2133,60 @@ class LinkedClocksFrame(ttk.Frame):
     # Reset all elapsed counters used for proportional overlays.
     def _reset_all_remaining(self):
         # Proportional timing uses elapsed; remaining is derived
-        self.elapsed_ms = [0 for _ in self.dials]  # NEW
-        # If you’re keeping `remaining` around for overlay compatibility elsewhere, you can also refresh it:
-        # self.remaining = [v.get() * 1000 for v in self.timer_secs]
+        for t in self.timers:
+            t.elapsed_ms = 0
 
     def _redraw_overlays(self):
         show = bool(self._show_overlay.get())
         timers = self._timers_in_use()
-        active = next((i for i,d in enumerate(self.dials) if not d.is_complete()), None)
+        overlay_color = self.overlay_color.get()
 
         for i, d in enumerate(self.dials):
             text = ""
-            if show and self._timers_in_use() and self.timer_secs[i].get() > 0:
-                total = self.timer_secs[i].get() * 1000
-                rem_ms = max(0, total - (self.elapsed_ms[i] if i < len(self.elapsed_ms) else 0))
+            timer = self.timers[i] if i < len(self.timers) else None
+            if show and timers and timer is not None and timer.timer_seconds > 0:
+                total = timer.timer_seconds * 1000
+                rem_ms = max(0, total - timer.elapsed_ms)
                 s = rem_ms // 1000
                 h, rem = divmod(s, 3600)
                 m, s = divmod(rem, 60)
                 text = f"{h:02d}:{m:02d}:{s:02d}"
             d._overlay_text = text
-            d._overlay_color = self.overlay_color.get()
-            d.draw()
+            d._overlay_color = overlay_color
+            d._schedule_draw()  # several callers may refresh overlays in one event; paint once
 
     def _active_index(self) -> int | None:
         return next((i for i, d in enumerate(self.dials) if not d.is_complete()), None)
 
     # Bind click handlers so only the active dial advances (or un-fills in manual mode).
     def _bind_serial_clicks(self):
-        """Only the active dial gets clicks. Left=advance. Right=unfill (only when timers are NOT used)."""
+        """Only the active dial gets clicks. Left=advance. Right=unfill (only when timers are NOT used).
+
+        Each dial's canvas keeps one fixed pair of handlers (bound in _add_dial); this only
+        records which dial they act on, so no Tcl callbacks are created per refresh.
+        """
         active = self._active_index()
-        timers = self._timers_in_use()
+        target = self.dials[active] if active is not None else None
+        self._click_target = (target, not self._timers_in_use())
 
-        for i, d in enumerate(self.dials):
-            # clear our binds
-            for seq in ("<Button-1>", "<Button-3>"):
-                # Additionally, prevent accidental interactions on inactive canvases
-                # by ignoring clicks. We only rebind for the active dial below.
-                d.canvas.bind("<Button-1>", lambda e: None)
-                d.canvas.bind("<Button-3>", lambda e: None)
-                try:
-                    d.canvas.unbind(seq)
-                except Exception:
-                    pass
+    # Left click on a dial: advance it by one if it is the active dial.
+    def _on_dial_left_click(self, dial, event=None):
+        if dial is not self._click_target[0]:
+            return
+        getattr(dial, "_parse_timer", lambda *a, **k: None)()  # commit HH:MM:SS if user just typed
+        dial.increase()
+        self._redraw_overlays()
+        self._bind_serial_clicks()
 
-            if active is None:
-                continue  # everything complete
-
-            if i == active:
-                # left click always advances one
-                d.canvas.bind("<Button-1>", lambda e, di=d: (
-                    getattr(di, "_parse_timer", lambda *a, **k: None)(),  # commit HH:MM:SS if user just typed
-                    di.increase(),
-                    self._redraw_overlays(),
-                    self._bind_serial_clicks()
-                ))
-
-                # right click: only in manual mode (no timers anywhere)
-                if not timers:
-                    # Helper method: Unfill.
-                    def _unfill(_e, di=d):
-                        # Use the public API so any future side‑effects stay consistent
-                        di.decrease()
-                        self._redraw_overlays()
-                        self._bind_serial_clicks()
-
-                    d.canvas.bind("<Button-3>", _unfill)
+    # Right click on a dial: unfill one if it is the active dial (manual mode only; no timers).
+    def _on_dial_right_click(self, dial, event=None):
+        target, can_unfill = self._click_target
+        if dial is not target or not can_unfill:
+            return
+        # Use the public API so any future side‑effects stay consistent
+        dial.decrease()
+        self._redraw_overlays()
+        self._bind_serial_clicks()
 
     # ------------- Layout / building -------------
 
@@ -1731,11 +2205,14 @@ class LinkedClocksFrame(ttk.Frame):
             click_mode="serial_next",  # per spec: click anywhere => fill next segment
             linked_parent=self  # let the dial ask us to reset its timer
         )
+        # Fixed click handlers; _bind_serial_clicks() decides which dial they act on
+        dial.canvas.bind("<Button-1>", functools.partial(self._on_dial_left_click, dial))
+        dial.canvas.bind("<Button-3>", functools.partial(self._on_dial_right_click, dial))
 
         # Per-dial timer UI under each dial
         ctrl = ttk.Frame(dial); ctrl.grid(row=3, column=0, columnspan=8, sticky="we", pady=(0,6))
         ttk.Label(ctrl, text="Countdown (HH:MM:SS):").pack(side="left")
-        var = tk.IntVar(value=0)  # store seconds
+        timer = DialTimerState()  # configured seconds + elapsed ms
         ent = ttk.Entry(ctrl, width=10, justify="center")
         ent.pack(side="left", padx=(4, 8))
         # Keep a handle so we can rewrite the text when timers are reset
@@ -1745,9 +2222,10 @@ class LinkedClocksFrame(ttk.Frame):
 
         # Helper method: Parse and set.
         def parse_and_set(*_):
+            before = timer.timer_seconds
             txt = ent.get().strip()
             if not txt:
-                var.set(0)
+                timer.timer_seconds = 0
             else:
                 try:
                     parts = txt.split(":")
@@ -1759,10 +2237,17 @@ class LinkedClocksFrame(ttk.Frame):
                     else:
                         hh, mm, ss = parts[-3], parts[-2], parts[-1]
                         total = int(hh) * 3600 + int(mm) * 60 + int(ss)
-                    var.set(max(0, total))
+                    timer.timer_seconds = min(max(0, total), MAX_TIMER_SECONDS)
+                    if total > MAX_TIMER_SECONDS:
+                        # Show the clamped value rather than the out-of-range text
+                        ent.delete(0, "end")
+                        ent.insert(0, "99:59:59")
                 except Exception:
                     # keep old; lightly notify?
                     pass
+            # Runs on every focus-out/Return: only a new duration is a session change
+            if timer.timer_seconds != before:
+                _mark_dirty(self)
             self._reset_all_remaining()
             self._validate_start_button()
             self._redraw_overlays()
@@ -1775,9 +2260,9 @@ class LinkedClocksFrame(ttk.Frame):
 
         # Notes button (already on dial top bar), Fill Color already present
         # Store & place dial
-        self.timer_secs.append(var)
+        self.timers.append(timer)
         self.dials.append(dial)
-        self.elapsed_ms.append(0)
+        _mark_dirty(self)
 
         self._relayout()
         self._bind_serial_clicks()
@@ -1789,9 +2274,9 @@ class LinkedClocksFrame(ttk.Frame):
         d = self.dials.pop()
         try: d.destroy()
         except Exception: pass
-        self.timer_secs.pop()
-        if self.elapsed_ms:
-            self.elapsed_ms.pop()
+        if self.timers:
+            self.timers.pop()
+        _mark_dirty(self)
         self._relayout()
         self._validate_start_button()
         self._redraw_overlays()
@@ -1804,14 +2289,8 @@ class LinkedClocksFrame(ttk.Frame):
             w = max(1, int(self.dials_frame.winfo_width()))
         except Exception:
             w = 900
-
-        # Breakpoints tuned for your controls so things don’t squeeze/clamp
-        if w < 720:
-            cols = 1
-        elif w < 1080:
-            cols = 2
-        else:
-            cols = 3
+        cols = self._columns_for(w)
+        self._grid_cols = cols
 
         # Reset grid weights
         for c in range(3):
@@ -1838,6 +2317,21 @@ class LinkedClocksFrame(ttk.Frame):
             r, c = divmod(i, cols)
             wgt.grid(row=r, column=c, sticky="nsew", padx=6, pady=6)
 
+    # Number of dial columns that fit in `width` pixels.
+    @staticmethod
+    def _columns_for(width: int) -> int:
+        # Breakpoints tuned for your controls so things don’t squeeze/clamp
+        if width < 720:
+            return 1
+        elif width < 1080:
+            return 2
+        return 3
+
+    # Dial area resized: re-grid only when the width crosses a column breakpoint.
+    def _on_dials_configure(self, event):
+        if self._columns_for(max(1, event.width)) != self._grid_cols:
+            self._relayout()
+
     # Emit a brief audible notification (system beep) on completion.
     def _beep_once(self):
         """Play a single ding when a dial completes (original behavior)."""
@@ -1892,7 +2386,10 @@ class LinkedClocksFrame(ttk.Frame):
     # ------------- Persistence -------------
 
     def to_dict(self) -> dict:
-        return {
+        cached = self._dict_cache
+        if cached is not None:
+            return cached  # nothing changed since the last save (see _mark_dirty)
+        self._dict_cache = result = {
             "type": self.TYPE,
             "title": self.title_var.get(),
             "segments": int(self.segments_var.get()),
@@ -1903,45 +2400,48 @@ class LinkedClocksFrame(ttk.Frame):
             "dials": [
                 {
                     **d.to_dict(),
-                    "timer_seconds": int(self.timer_secs[i].get())
+                    "timer_seconds": int(t.timer_seconds)
                 }
-                for i, d in enumerate(self.dials)
+                for d, t in zip(self.dials, self.timers)
             ],
         }
+        return result
 
     # Load state from a previously serialized dict.
     def from_dict(self, data: dict):
-        self.title_var.set(data.get("title", "Linked Clocks"))
-        self.segments_var.set(int(data.get("segments", 4)))
-        self.inverted_var.set(bool(data.get("inverted", False)))
-        self.notes = data.get("notes", "")
-        self._show_overlay.set(bool(data.get("show_overlay", False)))
-        self.beep_on_complete.set(bool(data.get("beep_on_complete", False)))
+        self._dict_cache = None
+        # A reused tab may still be counting down; stop before replacing its dials.
+        self.stop()
 
-        # Rebuild dials
+        # Drop the old dials first so the shared-var writes below don't redraw widgets about to go away
         for d in self.dials:
             try:
                 d.destroy()
             except Exception:
                 pass
         self.dials.clear();
-        self.timer_secs.clear();
-        self.elapsed_ms.clear()
+        self.timers.clear()
+
+        self.title_var.set(data.get("title", "Linked Clocks"))
+        self.segments_var.set(int(data.get("segments", 4)))
+        self.inverted_var.set(bool(data.get("inverted", False)))
+        self.notes = data.get("notes", "")
+        self._show_overlay.set(bool(data.get("show_overlay", False)))
+        self.beep_on_complete.set(bool(data.get("beep_on_complete", False)))
 
+        # Rebuild dials
 
         dials_data = data.get("dials") or []
         target = max(2, min(len(dials_data) or 2, self.MAX_DIALS))
         for _ in range(target): self._add_dial()
 
         for i, dd in enumerate(dials_data[:len(self.dials)]):
-            # feed dial state; strip conflicting fields
+            # feed dial state (shared segments/inverted stay as set above)
             if isinstance(dd, dict):
-                dd = dict(dd)
-                dd.pop("segments", None); dd.pop("inverted", None)
                 self.dials[i].from_dict(dd)
 
                 tsec = int(dd.get("timer_seconds", 0))
-                self.timer_secs[i].set(max(0, tsec))
+                self.timers[i].timer_seconds = min(max(0, tsec), MAX_TIMER_SECONDS)
 
         self._reset_all_remaining()
         self._redraw_overlays()
@@ -1951,6 +2451,17 @@ class LinkedClocksFrame(ttk.Frame):
     # Helper method: Destroy.
     def destroy(self):
         self._cancel_tick()
+        try:
+            self.segments_var.trace_remove("write", self._seg_trace)
+            self.inverted_var.trace_remove("write", self._inv_trace)
+        except Exception:
+            pass
+        for var, trace_id in self._flag_traces:
+            try:
+                var.trace_remove("write", trace_id)
+            except Exception:
+                pass
+        self._flag_traces.clear()
         super().destroy()
 
 class TugOfWarFrame(ttk.Frame):
@@ -1961,12 +2472,17 @@ class TugOfWarFrame(ttk.Frame):
     - Win: bar fully on one side -> announce that side's Outcome text
     """
     TYPE = "tug"
+    _dict_cache = None  # memoized to_dict(); cleared by _mark_dirty() on any change
 
     STEP_CHOICES = (4, 6, 8, 12)  # clicks to fully win either side (like Segments)
 
     # Helper method: Init.
     def __init__(self, master, initial_title="Tug-of-War", notes="", initial_steps=6, inverted=False):
         super().__init__(master)
+        # Pending after_idle redraw; see _schedule_draw().
+        self._redraw_job = None
+        # Fallback redraw while the canvas is still too small (at most one queued).
+        self._small_retry_job = None
 
         self.title_var = tk.StringVar(value=initial_title)
         self.notes = notes or ""
@@ -1987,6 +2503,13 @@ class TugOfWarFrame(ttk.Frame):
         self.left_color  = "#2ECC71"   # green
         self.right_color = "#E74C3C"   # red
 
+        # Any change to the saved variables marks the session dirty.
+        # (var, trace id) pairs, detached in destroy() so the Tcl callbacks don't pin this frame
+        self._var_traces = [
+            (var, var.trace_add("write", lambda *_: _mark_dirty(self)))
+            for var in (self.title_var, self.inverted, self.steps, self.shift, self.left_outcome, self.right_outcome)
+        ]
+
         # ---- Top bar ----
         top = ttk.Frame(self)
         top.pack(fill="x", padx=8, pady=(8, 0))
@@ -1995,8 +2518,9 @@ class TugOfWarFrame(ttk.Frame):
         ent = ttk.Entry(top, textvariable=self.title_var, width=28, justify="center")
         ent.pack(side="left", padx=(6, 12))
         # Live‑update the bar title as the Tab Title changes
-        self.title_var.trace_add("write", lambda *_: self.draw())
-        ent.bind("<KeyRelease>", lambda e: self.draw())
+        draw_trace = self.title_var.trace_add("write", lambda *_: self._schedule_draw())
+        self._var_traces.append((self.title_var, draw_trace))
+        ent.bind("<KeyRelease>", lambda e: self._schedule_draw())
 
         ttk.Label(top, text="Length (steps):").pack(side="left", padx=(0, 6))
         step_box = ttk.Combobox(top, state="readonly", values=self.STEP_CHOICES, width=6, textvariable=self.steps)
@@ -2009,7 +2533,12 @@ class TugOfWarFrame(ttk.Frame):
         # ---- Canvas area ----
         self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True, padx=8, pady=8)
-        self.canvas.bind("<Configure>", lambda e: self.draw())
+        self.canvas.bind("<Configure>", lambda e: self._schedule_draw())
+        # Title font (re-sized to fit on each draw) and the outcome entries embedded in the canvas
+        self._title_font = tkfont.Font(family="Arial", size=16, weight="bold")
+        self._left_entry = ttk.Entry(self, textvariable=self.left_outcome, justify="center", width=24)
+        self._right_entry = ttk.Entry(self, textvariable=self.right_outcome, justify="center", width=24)
+        self._build_canvas_items()
 
         # ---- Controls under the scrimmage line ----
         controls = ttk.Frame(self)
@@ -2029,13 +2558,14 @@ class TugOfWarFrame(ttk.Frame):
         ttk.Button(colors, text="Outcome B Fill Color", command=lambda: self._choose_color(side="right")).pack(side="left", padx=6)
 
 
-        self.after_idle(self.draw)
+        self._schedule_draw()
 
     # ---------- UI actions ----------
     def open_notes(self):
         res = open_notes_modal(self, self.notes, self.title_var.get() or "Tug-of-War")
-        if res is not None:
+        if res is not None and res != self.notes:
             self.notes = res
+            _mark_dirty(self)
 
     # Open a modal with settings toggles and apply changes.
     def open_settings(self):
@@ -2043,11 +2573,12 @@ class TugOfWarFrame(ttk.Frame):
         dlg = SimpleSettingsDialog(self.winfo_toplevel(), "Tug-of-War Settings", items)
         self.wait_window(dlg)
         if dlg.result:
-            self.draw()
+            self._schedule_draw()
 
     # Helper method: Choose color.
     def _choose_color(self, side="left"):
         label = "Outcome A" if side == "left" else "Outcome B"
+        from tkinter import colorchooser
         (rgb, hexv) = colorchooser.askcolor(
             color=self.left_color if side == "left" else self.right_color,
             title=f"Choose {label} Fill Color",
@@ -2059,31 +2590,36 @@ class TugOfWarFrame(ttk.Frame):
                 self.left_color = hexv
             else:
                 self.right_color = hexv
-            self.draw()
+            _mark_dirty(self)
+            self._schedule_draw()
 
     # Clamp tug-of-war shift to the new steps length and redraw.
     def _on_steps_changed(self):
         # Clamp shift to new range
         s = int(self.steps.get())
         self.shift.set(max(-s, min(self.shift.get(), s)))
-        self.draw()
+        self._schedule_draw()
 
     # Shift tug-of-war one step to the left and announce left win if reached.
     def pull_left(self):
         s = int(self.steps.get())
-        if self.shift.get() > -s:
-            self.shift.set(self.shift.get() - 1)
+        shift = int(self.shift.get())
+        if shift > -s:
+            shift -= 1
+            self.shift.set(shift)
             self.draw()
-            if self.shift.get() == -s:
+            if shift == -s:
                 messagebox.showinfo("Tug-of-War", f"{self.left_outcome.get().strip() or 'Left'} wins!", parent=self.winfo_toplevel())
 
     # Shift tug-of-war one step to the right and announce right win if reached.
     def pull_right(self):
         s = int(self.steps.get())
-        if self.shift.get() <  s:
-            self.shift.set(self.shift.get() + 1)
+        shift = int(self.shift.get())
+        if shift < s:
+            shift += 1
+            self.shift.set(shift)
             self.draw()
-            if self.shift.get() == s:
+            if shift == s:
                 messagebox.showinfo("Tug-of-War", f"{self.right_outcome.get().strip() or 'Right'} wins!", parent=self.winfo_toplevel())
 
     # Clear progress (unfill all segments).
@@ -2093,11 +2629,63 @@ class TugOfWarFrame(ttk.Frame):
         # Reset colors to defaults (Outcome A = Green, Outcome B = Red)
         self.left_color = "#2ECC71"  # green
         self.right_color = "#E74C3C"  # red
-        self.draw()
+        _mark_dirty(self)
+        self._schedule_draw()
 
     # ---------- Drawing ----------
     def _colors(self):
-        return {"bg": "black", "fg": "white"} if self.inverted.get() else {"bg": "white", "fg": "black"}
+        return DARK_COLORS if self.inverted.get() else LIGHT_COLORS
+
+    # Request a redraw on the next idle pass; repeated requests collapse into one.
+    def _schedule_draw(self):
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._do_draw)
+
+    # Run the coalesced redraw scheduled by _schedule_draw().
+    def _do_draw(self):
+        self._redraw_job = None
+        self.draw()
+
+    # Helper method: Destroy.
+    def destroy(self):
+        for attr in ("_redraw_job", "_small_retry_job"):
+            job = getattr(self, attr)
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+        for var, trace_id in self._var_traces:
+            try:
+                var.trace_remove("write", trace_id)
+            except Exception:
+                pass
+        self._var_traces.clear()
+        super().destroy()
+
+    # Canvas too small to paint yet: try again shortly, unless a retry is already queued.
+    def _retry_draw_later(self):
+        if self._small_retry_job is None:
+            self._small_retry_job = self.after(50, self._on_small_retry)
+
+    # Helper method: On small retry.
+    def _on_small_retry(self):
+        self._small_retry_job = None
+        self._schedule_draw()
+
+    # Create the persistent canvas items that draw() moves/recolors in place (z-order bottom→top).
+    def _build_canvas_items(self):
+        c = self.canvas
+        self._title_id = c.create_text(0, 0, text="", anchor="n")
+        self._title_fit_key = None  # (avail_w, text) the title font was last fitted to
+        self._left_win = c.create_window(0, 0, window=self._left_entry, anchor="center", state="hidden")
+        self._right_win = c.create_window(0, 0, window=self._right_entry, anchor="center", state="hidden")
+        # One rectangle per rope segment at the longest length; extras stay hidden
+        self._seg_ids = [c.create_rectangle(0, 0, 0, 0, width=1, state="hidden")
+                         for _ in range(2 * max(self.STEP_CHOICES))]
+        # Scrimmage line overlay (fixed at true center), above the rope
+        self._line_id = c.create_line(0, 0, 0, 0, width=2)
 
     # Render/redraw the widget canvas based on current state.
     def draw(self):
@@ -2106,23 +2694,28 @@ class TugOfWarFrame(ttk.Frame):
         c = self.canvas
         w = max(1, c.winfo_width()); h = max(1, c.winfo_height())
         if w < 300 or h < 160:
-            c.after(50, self.draw); return
+            self._retry_draw_later(); return
 
         colors = self._colors()
-        c.delete("all")
+        fg = colors["fg"]
         c.configure(bg=colors["bg"])
 
-        # Title (auto-fit)
+        # Title (auto-fit; re-measured only when the text or width changed)
         title_text = self.title_var.get()
         avail_w = max(1, w - 2 * PADDING)
-        size = 16
-        try:
-            f = tkfont.Font(family="Arial", size=size, weight="bold")
-            while f.measure(title_text) > avail_w and size > 9:
-                size -= 1; f.configure(size=size)
-        except Exception:
-            f = ("Arial", 12, "bold")
-        c.create_text(w/2, 8, text=title_text, fill=colors["fg"], font=f, anchor="n")
+        if (avail_w, title_text) != self._title_fit_key:
+            self._title_fit_key = (avail_w, title_text)
+            size = 16
+            try:
+                f = self._title_font
+                f.configure(size=size)
+                while f.measure(title_text) > avail_w and size > 9:
+                    size -= 1; f.configure(size=size)
+            except Exception:
+                f = ("Arial", 12, "bold")
+            c.itemconfigure(self._title_id, text=title_text, font=f)
+        c.coords(self._title_id, w/2, 8)
+        c.itemconfigure(self._title_id, fill=fg)
 
         # Layout rect
         top_y = TITLE_SPACE + 4
@@ -2131,17 +2724,12 @@ class TugOfWarFrame(ttk.Frame):
         cx = w / 2
 
         # Outcomes (entries) above each half
-        # Left entry
-        le = ttk.Entry(self, textvariable=self.left_outcome, justify="center", width=24)
-        re = ttk.Entry(self, textvariable=self.right_outcome, justify="center", width=24)
-
         # Move labels well above the bar so they never collide with moving segments
         labels_y = top_y - 10
-        c.create_window(cx - w*0.25, labels_y, window=le, anchor="center")
-        c.create_window(cx + w*0.25, labels_y, window=re, anchor="center")
-
-        # Scrimmage line (fixed)
-        c.create_line(cx, top_y+6, cx, bottom_y-6, fill=colors["fg"], width=2)
+        c.coords(self._left_win, cx - w*0.25, labels_y)
+        c.coords(self._right_win, cx + w*0.25, labels_y)
+        c.itemconfigure(self._left_win, state="normal")
+        c.itemconfigure(self._right_win, state="normal")
 
         # Bar geometry
         total_w = min(w - 2*PADDING, 720)
@@ -2163,18 +2751,25 @@ class TugOfWarFrame(ttk.Frame):
         left_count = max(0, min(total_segments, left_count))
 
         # Paint the entire rope each draw so it clearly "slides" across the scrimmage line.
-        for j in range(total_segments):
+        coords, itemconfigure = c.coords, c.itemconfigure
+        for j, seg_id in enumerate(self._seg_ids):
+            if j >= total_segments:
+                itemconfigure(seg_id, state="hidden")
+                continue
             seg_x0 = start_x + j * seg_w
-            seg_x1 = seg_x0 + seg_w
+            coords(seg_id, seg_x0, y0, seg_x0 + seg_w, y1)
             fill = self.left_color if j < left_count else self.right_color
-            c.create_rectangle(seg_x0, y0, seg_x1, y1, fill=fill, outline=colors["fg"], width=1)
+            itemconfigure(seg_id, fill=fill, outline=fg, state="normal")
 
-        # Scrimmage line overlay (fixed at true center)
-        c.create_line(cx, top_y+6, cx, bottom_y-6, fill=colors["fg"], width=2)
+        c.coords(self._line_id, cx, top_y+6, cx, bottom_y-6)
+        c.itemconfigure(self._line_id, fill=fg)
 
     # ---------- Persistence ----------
     def to_dict(self) -> dict:
-        return {
+        cached = self._dict_cache
+        if cached is not None:
+            return cached  # nothing changed since the last save (see _mark_dirty)
+        self._dict_cache = d = {
             "type": self.TYPE,
             "title": self.title_var.get(),
             "notes": self.notes,
@@ -2186,9 +2781,11 @@ class TugOfWarFrame(ttk.Frame):
             "left_color": self.left_color,
             "right_color": self.right_color,
         }
+        return d
 
     # Load state from a previously serialized dict.
     def from_dict(self, data: dict):
+        self._dict_cache = None
         self.title_var.set(data.get("title", "Tug-of-War"))
         self.notes = data.get("notes", "")
         self.inverted.set(bool(data.get("inverted", False)))
@@ -2198,8 +2795,32 @@ class TugOfWarFrame(ttk.Frame):
         self.right_outcome.set(str(data.get("right_outcome", "Outcome B")))
         self.left_color  = data.get("left_color",  self.left_color)
         self.right_color = data.get("right_color", self.right_color)
-        self._on_steps_changed()
-        self.draw()
+        self._on_steps_changed()  # clamps shift and schedules the redraw
+
+
+# ---------------------------
+# Pending tab (lazy session load)
+# ---------------------------
+class PendingTab(ttk.Frame):
+    """
+    Empty stand-in for a loaded tab that has not been shown yet.
+    Holds the saved dict; MultiClockApp builds the real frame on first selection.
+    """
+    # Helper method: Init.
+    def __init__(self, master, item: dict):
+        super().__init__(master)
+        self.TYPE = item.get("type")
+        self.item = item
+        self.title_var = tk.StringVar(self, value=item.get("title", ""))
+
+    # Serialize: the saved dict, unchanged.
+    def to_dict(self) -> dict:
+        return self.item
+
+    # Replace the saved dict (reused in place by a later load).
+    def from_dict(self, data: dict):
+        self.item = data
+        self.title_var.set(data.get("title", ""))
 
 
 # ---------------------------
@@ -2208,6 +2829,9 @@ class TugOfWarFrame(ttk.Frame):
 # ---------------------------
 class MultiClockApp(tk.Tk):
     """ Main Tk application window. Manages menus, tabs, autosave, and persistence for all clock types. """
+    # Tab classes that serialize with to_dict() (placeholders hold their saved dict until shown).
+    _SAVABLE_TABS = (DangerClockFrame, RacingClocksFrame, LinkedClocksFrame, TugOfWarFrame, PendingTab)
+
     # Helper method: Init.
     def __init__(self):
         super().__init__()
@@ -2242,8 +2866,44 @@ class MultiClockApp(tk.Tk):
         # (If we auto-load, we'll set this below.)
         self.current_session_path: Path | None = None
 
+        # Auto-numbering index, kept current by title traces:
+        #   base title -> Counter of numbers in use; frame -> (base, number) it holds.
+        self._title_numbers: dict[str, Counter] = {}
+        self._frame_title_number: dict = {}
+        # Notebook tab id (widget path) -> tab frame; filled by _frame_from_tab, pruned by _discard_tab.
+        self._tab_frames: dict[str, tk.Widget] = {}
+
+        # True once the session has changed since it was last saved/loaded.
+        self._dirty = False
+        # Set while _load_from_path swaps tabs; tab-change events are handled once at the end.
+        self._loading = False
+
+        # Saved tab type -> (add_* factory, default title = auto-numbering base).
+        self._tab_factories = {
+            DangerClockFrame.TYPE: (self.add_danger_clock, "Danger Clock"),
+            RacingClocksFrame.TYPE: (self.add_racing_clocks, "Racing Clock"),
+            LinkedClocksFrame.TYPE: (self.add_linked_clocks, "Linked Clocks"),
+            TugOfWarFrame.TYPE: (self.add_tug_of_war, "Tug-of-War"),
+        }
+
+        # Autosave writes run on a worker thread fed one snapshot at a time;
+        # the lock keeps them from overlapping manual/exit saves.
+        self._save_lock = threading.Lock()
+        self._last_written = None  # (path, hash of bytes) of the last session file written
+        self._encoded_items = {}   # id(item dict) -> (item, its JSON bytes) from the last encode
+        self._save_q = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        # Settings writes go to their own single worker; a newer request replaces a queued one.
+        self._settings_io_pool = ThreadPoolExecutor(max_workers=1)
+        self._settings_future = None
+
         # Tk "after" job handle for autosave loop.
         self._autosave_job = None
+        # True while the loop runs at the stretched (minimized) cadence.
+        self._autosave_backed_off = False
+        # time.monotonic() of the first edit since the session was last clean (debounce cap).
+        self._dirty_since = 0.0
 
         # Build menus AFTER we have self.settings
         self._build_menu()
@@ -2264,6 +2924,7 @@ class MultiClockApp(tk.Tk):
         # ---- Notebook in the middle ----
         self.nb = ttk.Notebook(self)
         self.nb.pack(fill="both", expand=True)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Decide how to start
         opened_from_settings = False
@@ -2281,33 +2942,147 @@ class MultiClockApp(tk.Tk):
         if not opened_from_settings:
             # start with one empty tab
             self.add_danger_clock()
+        # Building the initial tabs is not an edit.
+        self._dirty = False
 
         # Save-on-exit hook
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Restore the normal autosave cadence when the window is shown again
+        self.bind("<Map>", self._on_map, add="+")
 
         # Start the autosave loop.
         self._start_autosave()
 
     # ---------- Autosave & Exit ----------
 
+    # Note that the session has unsaved changes (called by tabs on every edit).
+    def mark_dirty(self):
+        """Flag unsaved changes and debounce an autosave to just after this burst of edits."""
+        now = time.monotonic()
+        if not self._dirty:
+            self._dirty_since = now
+        self._dirty = True
+        if self._loading:
+            return  # a load fires this per setter of every tab, and ends clean anyway
+        # Each edit pushes the save back; a steady stream of edits still saves every AUTOSAVE_MS.
+        if (now - self._dirty_since) * 1000 < AUTOSAVE_MS:
+            self._schedule_next_autosave(AUTOSAVE_DEBOUNCE_MS)
+
+    def _serializable_frames(self) -> list:
+        """Tab frames that can be saved (instances of the registered tab classes)."""
+        savable, frame_from_tab = self._SAVABLE_TABS, self._frame_from_tab
+        return [frame for frame in map(frame_from_tab, self.nb.tabs()) if isinstance(frame, savable)]
+
     def _collect_tabs(self) -> list[dict]:
         """Gather JSON-serializable dicts from each tab via to_dict()."""
-        items = []
-        for tab_id in self.nb.tabs():
-            frame = self._frame_from_tab(tab_id)
-            if hasattr(frame, "to_dict"):
-                items.append(frame.to_dict())
-        return items
+        return [frame.to_dict() for frame in self._serializable_frames()]
 
     # Write the current session JSON to the given path.
     def _save_to_path(self, path: Path):
-        """Save current session to JSON at `path`."""
+        """Save current session to JSON at `path` now, on the calling (Tk) thread."""
+        # An older autosave snapshot still queued would otherwise land on top of this save
+        self._take_back_queued_save()
         items = self._collect_tabs()
         if not items:
             return  # nothing to save is fine (esp. for autosave)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"items": items}, f, ensure_ascii=False, indent=2)
+        self._write_session(path, items, durable=True)
+        self._dirty = False
+
+    def _write_session(self, path: Path, items: list[dict], durable: bool = False):
+        """Encode `items` and write them to `path` unless the file already holds exactly that.
+
+        Writes to a sibling temp file and swaps it in with os.replace(), so an
+        interrupted save never leaves a truncated session behind. `durable` also
+        fsyncs the temp file first. Touches no Tk state, so the autosave worker
+        thread calls it too (serialized by a lock).
+        """
+        with self._save_lock:
+            # Unchanged tabs hand back the same memoized to_dict() object: reuse its bytes.
+            # (Each entry keeps its dict alive, so an id() can't be recycled while cached.)
+            previous, encoded = self._encoded_items, {}
+            # Wrapper, items and commas go in one list so the file's bytes are copied once
+            parts = [b'{"items":[']
+            for item in items:
+                hit = previous.get(id(item))
+                data = hit[1] if hit is not None and hit[0] is item else _json_dumps(item)
+                encoded[id(item)] = (item, data)
+                parts.append(data)
+                parts.append(b",")
+            self._encoded_items = encoded
+            if len(parts) > 1:
+                parts.pop()  # trailing comma
+            parts.append(b"]}")
+            payload = b"".join(parts)
+            # Edits that were undone (e.g. a theme toggled twice) leave identical bytes: skip the write
+            written = (path, hash(payload))
+            if written == self._last_written and path.exists():
+                return
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            try:
+                with _open_tmp(tmp) as f:
+                    f.write(payload)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp, path)
+                self._last_written = written
+            except Exception:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+                raise
+
+    # Autosave worker thread: write queued (path, items, durable) snapshots until told to stop (None).
+    def _save_worker(self):
+        while True:
+            job = self._save_q.get()
+            if job is None:
+                return
+            path, items, durable = job
+            try:
+                # Off the Tk thread, so the fsync costs the UI nothing; a clean session
+                # isn't rewritten by later ticks, so this may be the copy that has to survive
+                self._write_session(path, items, durable=durable)
+            except Exception:
+                self._dirty = True  # silent, but retry on the next autosave tick
+
+    # Take back an autosave snapshot the worker hasn't started (the session stays dirty so the
+    # caller's save covers it); returns True if there was one.
+    def _take_back_queued_save(self) -> bool:
+        try:
+            job = self._save_q.get_nowait()
+        except queue.Empty:
+            return False
+        if job is None:
+            self._save_q.put_nowait(None)  # the exit path's stop sentinel stays for the worker
+            return False
+        self._dirty = True
+        return True
+
+    # Stop the worker before the final save on exit; an autosave it is writing is let finish.
+    def _stop_save_worker(self):
+        # A snapshot still waiting in the slot would just be rewritten by the exit save
+        self._take_back_queued_save()
+        try:
+            self._save_q.put(None, timeout=2)
+            self._save_thread.join(timeout=2)
+        except Exception:
+            pass
+
+    # Record `path` as the last session in the settings; writes them only if it changed.
+    def _remember_last_session(self, path: Path):
+        path = str(path)
+        if self.settings.get("last_session_path") != path:
+            self.settings["last_session_path"] = path
+            self._save_settings_async()
+
+    # Write a snapshot of the settings on the settings worker (the UI doesn't wait for the disk).
+    def _save_settings_async(self):
+        pending = self._settings_future
+        if pending is not None:
+            pending.cancel()  # superseded; no-op if it's already running
+        self._settings_future = self._settings_io_pool.submit(save_settings, dict(self.settings))
 
     # Begin the autosave loop.
     def _start_autosave(self):
@@ -2315,7 +3090,7 @@ class MultiClockApp(tk.Tk):
         self._schedule_next_autosave()
 
     # Set up the next autosave tick.
-    def _schedule_next_autosave(self):
+    def _schedule_next_autosave(self, delay_ms: int = AUTOSAVE_MS):
         """(Re)schedule next autosave tick."""
         if self._autosave_job:
             try:
@@ -2323,17 +3098,58 @@ class MultiClockApp(tk.Tk):
             except Exception:
                 pass
             self._autosave_job = None
-        self._autosave_job = self.after(AUTOSAVE_MS, self._autosave_tick)
+        self._autosave_job = self.after(delay_ms, self._autosave_tick)
+
+    # Return to the normal autosave cadence once the window is visible again.
+    def _on_map(self, event):
+        if event.widget is not self or not self._autosave_backed_off:
+            return
+        self._autosave_backed_off = False
+        # Changes made while hidden (e.g. running Linked timers) were never saved: flush them soon
+        self._schedule_next_autosave(AUTOSAVE_DEBOUNCE_MS if self._dirty else AUTOSAVE_MS)
 
     # Perform one autosave and reschedule the next.
     def _autosave_tick(self):
         """Do one autosave, then reschedule."""
+        # Minimized/hidden: nothing is being edited, so skip and back off.
+        try:
+            minimized = self.state() in ("iconic", "withdrawn")
+        except Exception:
+            minimized = False
+        if minimized:
+            self._autosave_backed_off = True
+            self._schedule_next_autosave(AUTOSAVE_MS * AUTOSAVE_IDLE_FACTOR)
+            return
+        # Nothing changed since the last save: skip the serialize/write entirely.
+        if not self._dirty:
+            self._schedule_next_autosave()
+            return
+
         try:
-            target = self.current_session_path or DEFAULT_SESSION_PATH
-            self._save_to_path(Path(target))
+            target = Path(self.current_session_path or DEFAULT_SESSION_PATH)
+            # Snapshot the tabs here (Tk thread); encoding + disk I/O happen on the worker.
+            items = self._collect_tabs()
+            if items:
+                job = (target, items, bool(self.settings.get("fsync_autosave", True)))
+                # Clear before the worker can see the job, so a write that fails fast
+                # (worker sets _dirty = True) can't be overwritten by this thread.
+                self._dirty = False
+                try:
+                    try:
+                        self._save_q.put_nowait(job)
+                    except queue.Full:
+                        # The previous snapshot hasn't been picked up yet: this newer one supersedes it
+                        # (only this thread puts, so once the slot is emptied the put succeeds).
+                        try:
+                            self._save_q.get_nowait()
+                        except queue.Empty:
+                            pass
+                        self._save_q.put_nowait(job)
+                except Exception:
+                    self._dirty = True  # not queued: retry on the next tick
+                    raise
             # record the autosave path as last session, too (optional)
-            self.settings["last_session_path"] = str(Path(target))
-            save_settings(self.settings)
+            self._remember_last_session(target)
 
         except Exception:
             # silent on autosave errors
@@ -2344,10 +3160,14 @@ class MultiClockApp(tk.Tk):
     # Persist window geometry and settings, stop autosave, and exit.
     def _on_close(self):
         """Final best-effort save, store window position, stop autosave, then close app."""
+        self._stop_save_worker()
+        # Let a queued settings write land before the final synchronous one below
+        self._settings_io_pool.shutdown(wait=True)
         try:
-            # Save session
-            target = self.current_session_path or DEFAULT_SESSION_PATH
-            self._save_to_path(Path(target))
+            # Save session (only if something changed since the last save)
+            if self._dirty:
+                target = self.current_session_path or DEFAULT_SESSION_PATH
+                self._save_to_path(Path(target))
         except Exception:
             pass
         finally:
@@ -2387,7 +3207,7 @@ class MultiClockApp(tk.Tk):
         filemenu.add_command(label="Save Session", command=self.save_session)
         filemenu.add_command(label="Load Session", command=self.load_session)
         filemenu.add_separator()
-        filemenu.add_command(label="Exit", command=self.destroy)
+        filemenu.add_command(label="Exit", command=self._on_close)
         menubar.add_cascade(label="File", menu=filemenu)
 
         # Settings menu
@@ -2398,73 +3218,71 @@ class MultiClockApp(tk.Tk):
             variable=self.open_last_var,
             command=self._on_toggle_open_last
         )
+        self.fsync_autosave_var = tk.BooleanVar(value=bool(self.settings.get("fsync_autosave", True)))
+        settings_menu.add_checkbutton(
+            label="Flush autosaves to disk (safer, slower)",
+            variable=self.fsync_autosave_var,
+            command=self._on_toggle_fsync_autosave
+        )
         menubar.add_cascade(label="Settings", menu=settings_menu)
 
         self.config(menu=menubar)
 
     # Persist the 'open last session on launch' setting.
     def _on_toggle_open_last(self):
-        self.settings["open_last_on_launch"] = bool(self.open_last_var.get())
-        save_settings(self.settings)
+        value = bool(self.open_last_var.get())
+        if self.settings.get("open_last_on_launch") == value:
+            return
+        self.settings["open_last_on_launch"] = value
+        self._save_settings_async()
+
+    # Persist the 'flush autosaves to disk' setting (manual and exit saves always flush).
+    def _on_toggle_fsync_autosave(self):
+        value = bool(self.fsync_autosave_var.get())
+        if self.settings.get("fsync_autosave", True) == value:
+            return
+        self.settings["fsync_autosave"] = value
+        self._save_settings_async()
 
     # ---------- Tabs ----------
 
-    def add_danger_clock(self, title=None, segments=4, filled=0, inverted=False, fill_color=None, notes=""):
+    def add_danger_clock(self, title=None, segments=4, filled=0, inverted=False, fill_color=None, notes="", select=True):
         # auto-number default titles
-        if title is None or not title.strip() or title.strip().startswith("Danger Clock"):
-            existing = [self._frame_from_tab(t).title_var.get()
-                        for t in self.nb.tabs()
-                        if isinstance(self._frame_from_tab(t), DangerClockFrame)]
-            if not title or not title.strip() or title.strip() == "Danger Clock":
-                title = _next_numbered_title(existing, "Danger Clock")
+        if not title or not title.strip() or title.strip() == "Danger Clock":
+            title = self._next_title("Danger Clock")
 
         frame = DangerClockFrame(self.nb, initial_title=title, segments=segments, filled=filled,
                                  inverted=inverted, fill_color=fill_color, notes=notes)
         self.nb.add(frame, text=self._short_title(title))
+        self._track_title_number(frame, "Danger Clock")
 
-        # Helper method: Sync.
-        def sync(*_):
-            idx = self.nb.index(frame)
-            self.nb.tab(idx, text=self._short_title(frame.title_var.get()))
-        frame.title_var.trace_add("write", lambda *_: sync())
-        self.nb.select(frame)
+        self._watch_title(frame, "Danger Clock")
+        if select:
+            self.nb.select(frame)
+        self.mark_dirty()
         return frame
 
     # Remove the currently selected tab (if any remain afterward).
     def remove_current(self):
-        if self.nb.index("end") == 0:
-            return
-        current = self.nb.select()
+        current = self.nb.select()  # "" when there are no tabs
         if current:
-            self.nb.forget(current)
+            self._discard_tab(self._frame_from_tab(current))
 
     # Create a new Racing Clocks tab with shared settings.
-    def add_racing_clocks(self, title=None, notes="", initial_dials=2):
+    def add_racing_clocks(self, title=None, notes="", initial_dials=2, select=True):
         # Auto-number default titles "Racing Clock n"
-        existing = []
-        for tab_id in self.nb.tabs():
-            frame = self._frame_from_tab(tab_id)
-            if hasattr(frame, "title_var") and getattr(frame, "TYPE", "") == "racing":
-                existing.append(frame.title_var.get())
         base = "Racing Clock"
-        default_title = _next_numbered_title(existing, base)
-        title = (title or default_title).strip()
+        title = (title or self._next_title(base)).strip()
 
         # pass initial_dials through (not used on load; only for user-created tabs)
         frame = RacingClocksFrame(self.nb, initial_title=title, notes=notes, initial_dials=initial_dials)
         self.nb.add(frame, text=self._short_title(title))
+        self._track_title_number(frame, base)
 
-        # Helper method: Sync.
-        def sync(*_):
-            try:
-                idx = self.nb.index(frame)
-                self.nb.tab(idx, text=self._short_title(frame.title_var.get()))
-            except Exception:
-                pass
-
-        frame.title_var.trace_add("write", lambda *_: sync())
-
-        self.nb.select(frame)
+        self._watch_title(frame, base)
+        if select:
+            self.nb.select(frame)
+        self.mark_dirty()
         return frame
 
 
@@ -2472,10 +3290,10 @@ class MultiClockApp(tk.Tk):
 
     def save_session(self):
         """Manual save with file chooser; remembers path for autosave."""
-        items = self._collect_tabs()
-        if not items:
+        if not self._serializable_frames():
             messagebox.showinfo("Nothing to save", "There are no tabs.", parent=self)
             return
+        from tkinter import filedialog
         path = filedialog.asksaveasfilename(
             title="Save session as JSON",
             defaultextension=".json",
@@ -2487,8 +3305,7 @@ class MultiClockApp(tk.Tk):
         try:
             self._save_to_path(Path(path))
             self.current_session_path = Path(path)  # remember for autosave
-            self.settings["last_session_path"] = str(self.current_session_path)
-            save_settings(self.settings)
+            self._remember_last_session(self.current_session_path)
             messagebox.showinfo("Saved", f"Saved to:\n{path}", parent=self)
         except Exception as e:
             messagebox.showerror("Save failed", f"{e}", parent=self)
@@ -2496,129 +3313,263 @@ class MultiClockApp(tk.Tk):
     # Prompt for a file and load a saved session.
     def load_session(self):
         """Manual load; rebuilds tabs; remembers path for autosave."""
+        from tkinter import filedialog
         path = filedialog.askopenfilename(title="Load session JSON",
-                                          filetypes=[("JSON files", "*.json")])
+                                          filetypes=[("JSON files", "*.json")],
+                                          parent=self)
         if not path:
             return
         try:
             self._load_from_path(Path(path))
             self.current_session_path = Path(path)  # remember for autosave
             # record for Settings
-            self.settings["last_session_path"] = str(self.current_session_path)
-            save_settings(self.settings)
-            messagebox.showinfo("Loaded", f"Loaded from:\n{path}")
+            self._remember_last_session(self.current_session_path)
+            messagebox.showinfo("Loaded", f"Loaded from:\n{path}", parent=self)
         except Exception as e:
-            messagebox.showerror("Load failed", f"{e}")
+            messagebox.showerror("Load failed", f"{e}", parent=self)
 
     # Rebuild tabs from a session JSON at a specific path.
     def _load_from_path(self, path: Path):
-        """Load a session JSON from a specific path (no file chooser)."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        """Load a session JSON from a specific path (no file chooser).
 
-        # Clear existing tabs
-        for tab_id in self.nb.tabs():
-            self.nb.forget(tab_id)
-
-        # Rebuild from saved items
-        for item in data.get("items", []):
+        Existing tabs are reused (and moved into place) for saved items of the same
+        type; only surplus tabs are destroyed and missing ones created.
+        """
+        data = _json_loads(Path(path).read_bytes())
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            # Checked before any tab is touched, so a wrong file leaves the open session intact
+            raise ValueError("Not a Progress Clocks session file (no \"items\" list).")
+
+        # Forgetting/inserting tabs fires <<NotebookTabChanged>> for every selection hop;
+        # without this, each hop could build (materialize) a placeholder tab that's about to go.
+        self._loading = True
+        try:
+            pos = self._rebuild_tabs(items)
+        finally:
+            self._loading = False
+
+        # Select once at the end (tabs were added without switching to each)
+        if pos:
+            self.nb.select(pos - 1)
+            self._on_tab_changed()
+
+        # The tabs now match the file on disk.
+        self._dirty = False
+
+    # Make the notebook hold one tab per saved item; returns the number of tabs kept.
+    def _rebuild_tabs(self, items: list) -> int:
+        # Open tabs, pooled by type in notebook order: any saved item of the same type can
+        # take one over (moved into place), so reordered sessions still reuse their widgets.
+        nb, frame_from_tab = self.nb, self._frame_from_tab
+        pool: dict[str, deque] = {}
+        for tab_id in nb.tabs():
+            frame = frame_from_tab(tab_id)
+            pool.setdefault(getattr(frame, "TYPE", None), deque()).append(frame)
+        pos = 0  # notebook index of the next tab to fill
+
+        # Rebuild from saved items (loop-invariant lookups bound once above/below)
+        factories = self._tab_factories
+        sync_tab_label, track_title_number = self._sync_tab_label, self._track_title_number
+        for item in items:
+            if not isinstance(item, dict):
+                continue
             t = item.get("type")
-            if t == DangerClockFrame.TYPE:
-                # Create a tab (title will be corrected by from_dict)
-                frame = self.add_danger_clock(title=item.get("title", "Danger Clock"))
-                if hasattr(frame, "from_dict"):
-                    frame.from_dict(item)
-
-            elif t == getattr(RacingClocksFrame, "TYPE", "racing"):
-                frame = self.add_racing_clocks(title=item.get("title", "Racing Clock"))
-                if hasattr(frame, "from_dict"):
-                    frame.from_dict(item)
-
-            elif t == getattr(LinkedClocksFrame, "TYPE", "linked"):
-                frame = self.add_linked_clocks(title=item.get("title", "Linked Clocks"))
-                if hasattr(frame, "from_dict"): frame.from_dict(item)
-
-            elif t == getattr(TugOfWarFrame, "TYPE", "tug"):
-                frame = self.add_tug_of_war(title=item.get("title", "Tug-of-War"))
-                if hasattr(frame, "from_dict"):
-                    frame.from_dict(item)
-
-            else:
+            factory = factories.get(t)
+            if factory is None:
                 # Unknown tab type; skip gracefully
                 continue
 
+            reusable = pool.get(t)
+            if reusable:
+                frame = reusable.popleft()
+            else:
+                # New tabs start as placeholders; the real frame is built when first shown
+                frame = PendingTab(nb, item)
+                nb.add(frame)
+            nb.insert(pos, frame)  # moves it into place (one call; no index lookup first)
+            frame.from_dict(item)
+            if isinstance(frame, PendingTab):
+                sync_tab_label(frame)
+                track_title_number(frame, factory[1])
+            pos += 1
+
+        # Drop tabs the loaded session doesn't use
+        for frames in pool.values():
+            for frame in frames:
+                self._discard_tab(frame)
+        return pos
+
+    # Remove a tab from the notebook and destroy its widgets.
+    def _discard_tab(self, frame):
+        self._untrack_title_number(frame)
+        self._tab_frames.pop(str(frame), None)
+        # Sever the tab-label sync trace so its closure (frame + notebook) can be released
+        trace_id = getattr(frame, "_tab_title_trace", None)
+        if trace_id:
+            try:
+                frame.title_var.trace_remove("write", trace_id)
+            except Exception:
+                pass
+            frame._tab_title_trace = None
+        job = getattr(frame, "_title_sync_job", None)
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+            frame._title_sync_job = None
+        try:
+            self.nb.forget(frame)
+        except Exception:
+            pass
+        try:
+            frame.destroy()
+        except Exception:
+            pass
+        self.mark_dirty()
+
     # ---------- Helpers ----------
 
+    # Record (or update) the auto-number this tab's title holds under `base`.
+    def _track_title_number(self, frame, base: str):
+        self._untrack_title_number(frame)
+        n = _title_number(frame.title_var.get(), base)
+        if n is not None:
+            self._title_numbers.setdefault(base, Counter())[n] += 1
+            self._frame_title_number[frame] = (base, n)
+
+    # Release the auto-number held by a tab that is being renamed or removed.
+    def _untrack_title_number(self, frame):
+        held = self._frame_title_number.pop(frame, None)
+        if held is None:
+            return
+        base, n = held
+        numbers = self._title_numbers.get(base)
+        if numbers is not None:
+            numbers[n] -= 1
+            if numbers[n] <= 0:
+                del numbers[n]
+
+    # Lowest free 'Base N' title according to the auto-numbering index.
+    def _next_title(self, base: str) -> str:
+        numbers = self._title_numbers.get(base)
+        if not numbers:
+            return f"{base} 1"  # first tab of its kind (or all renamed): nothing to probe
+        n = 1
+        while n in numbers:
+            n += 1
+        return f"{base} {n}"
+
+    # Tab frame for a notebook tab id (memoized; nametowidget walks the widget path every call).
     def _frame_from_tab(self, tab_id):
-        return self.nametowidget(tab_id)
+        key = str(tab_id)  # nb.select() may hand back a Tcl object
+        frame = self._tab_frames.get(key)
+        if frame is None:
+            frame = self._tab_frames[key] = self.nametowidget(key)
+        return frame
 
+    # Route keyboard shortcuts to the newly selected Danger Clock.
+    def _on_tab_changed(self, event=None):
+        if self._loading:
+            return
+        tab = self.nb.select()
+        if not tab:
+            return
+        frame = self._frame_from_tab(tab)
+        if isinstance(frame, PendingTab):
+            frame = self._materialize_tab(frame)
+        if isinstance(frame, DangerClockFrame):
+            frame._focus_canvas()
+
+    # Map a saved tab type to its (add_* factory, default title = auto-numbering base), or None.
+    def _tab_factory(self, tab_type):
+        return self._tab_factories.get(tab_type)
+
+    # Build the real frame for a placeholder tab and swap it into the same position.
+    def _materialize_tab(self, placeholder):
+        add, default_title = self._tab_factory(placeholder.TYPE)
+        item = placeholder.item
+        dirty = self._dirty  # building a tab from saved state is not an edit
+        frame = add(title=item.get("title", default_title), select=False)
+        self.nb.insert(self.nb.index(placeholder), frame)
+        frame.from_dict(item)
+        # Select the new frame before dropping the placeholder so the notebook doesn't hop tabs
+        self.nb.select(frame)
+        self._discard_tab(placeholder)
+        self._dirty = dirty
+        return frame
+
+    # Notebook tab text for a title (memoized: the same few titles repeat on every sync).
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _short_title(title: str) -> str:
         title = (title or "Clock").strip()
-        return (title[:18] + "…") if len(title) > 18 else title
+        return f"{title[:TAB_TITLE_MAX]}…" if len(title) > TAB_TITLE_MAX else title
+
+    # Keep a tab's label and auto-number in step with its title; a burst of edits
+    # (typing in the title entry) is folded into one update at idle time.
+    def _watch_title(self, frame, base: str):
+        frame._title_sync_job = None
+        frame._tab_title_trace = frame.title_var.trace_add(
+            "write", functools.partial(self._on_title_write, frame, base))
+
+    # Title trace: mark the session dirty and queue one label/number sync.
+    def _on_title_write(self, frame, base: str, *_):
+        _mark_dirty(frame)
+        if frame._title_sync_job is None:
+            frame._title_sync_job = self.after_idle(self._sync_title, frame, base)
+
+    # Idle half of _watch_title: refresh the tab label and the auto-number index.
+    def _sync_title(self, frame, base: str):
+        frame._title_sync_job = None
+        self._sync_tab_label(frame)
+        self._track_title_number(frame, base)
+
+    # Relabel a tab from its title; skips the notebook call when the truncated text is unchanged.
+    def _sync_tab_label(self, frame):
+        raw = frame.title_var.get()
+        if raw == getattr(frame, "_tab_label_src", None):
+            return  # same title as the last sync (e.g. a reused tab loaded with its old name)
+        frame._tab_label_src = raw
+        text = self._short_title(raw)
+        if text == getattr(frame, "_tab_label", None):
+            return
+        frame._tab_label = text
+        try:
+            self.nb.tab(frame, text=text)
+        except Exception:
+            pass
 
     # Create a new Linked Clocks tab with serial progression.
-    def add_linked_clocks(self, title=None, notes="", initial_dials=2):
-        existing = []
-        for tab_id in self.nb.tabs():
-            frame = self._frame_from_tab(tab_id)
-            if hasattr(frame, "title_var") and getattr(frame, "TYPE", "") == "linked":
-                existing.append(frame.title_var.get())
+    def add_linked_clocks(self, title=None, notes="", initial_dials=2, select=True):
         base = "Linked Clocks"
-        default_title = _next_numbered_title(existing, base)
-        title = (title or default_title).strip()
+        title = (title or self._next_title(base)).strip()
 
         frame = LinkedClocksFrame(self.nb, initial_title=title, notes=notes, initial_dials=initial_dials)
         self.nb.add(frame, text=self._short_title(title))
+        self._track_title_number(frame, base)
 
-        # Helper method: Sync.
-        def sync(*_):
-            try:
-                idx = self.nb.index(frame)
-                self.nb.tab(idx, text=self._short_title(frame.title_var.get()))
-            except Exception:
-                pass
-
-        frame.title_var.trace_add("write", lambda *_: sync())
-
-        self.nb.select(frame)
+        self._watch_title(frame, base)
+        if select:
+            self.nb.select(frame)
+        self.mark_dirty()
         return frame
 
     # Create a new Tug-of-War tab.
-    def add_tug_of_war(self, title=None, notes="", initial_steps=6):
+    def add_tug_of_war(self, title=None, notes="", initial_steps=6, select=True):
         # Auto-number default titles "Tug-of-War n"
-        existing = []
-        for tab_id in self.nb.tabs():
-            frame = self._frame_from_tab(tab_id)
-            if hasattr(frame, "title_var") and getattr(frame, "TYPE", "") == "tug":
-                existing.append(frame.title_var.get())
         base = "Tug-of-War"
-        try:
-            default_title = _next_numbered_title(existing, base)
-        except Exception:
-            # Fallback if helper is missing
-            n = 1
-            used = set(existing)
-            default_title = base
-            while default_title in used:
-                n += 1
-                default_title = f"{base} {n}"
-
-        title = (title or default_title).strip()
+        title = (title or self._next_title(base)).strip()
 
         frame = TugOfWarFrame(self.nb, initial_title=title, notes=notes, initial_steps=initial_steps)
         self.nb.add(frame, text=self._short_title(title))
+        self._track_title_number(frame, base)
 
-        # Helper method: Sync.
-        def sync(*_):
-            try:
-                idx = self.nb.index(frame)
-                self.nb.tab(idx, text=self._short_title(frame.title_var.get()))
-            except Exception:
-                pass
-
-        frame.title_var.trace_add("write", lambda *_: sync())
-        self.nb.select(frame)
+        self._watch_title(frame, base)
+        if select:
+            self.nb.select(frame)
+        self.mark_dirty()
         return frame
 
 